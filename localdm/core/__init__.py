@@ -6,9 +6,15 @@ from localdm.core.storage import (
 from localdm.core.storage import (
     get_object_path as get_object_path,
 )
+from localdm.core.storage import (
+    get_tmp_dir as get_tmp_dir,
+)
 from localdm.core.storage import (
     init_repo as init_repo,
 )
+from localdm.core.utils import (
+    clear_load_file_cache as clear_load_file_cache,
+)
 from localdm.core.utils import (
     compute_hash as compute_hash,
 )
@@ -18,17 +24,23 @@ from localdm.core.utils import (
 from localdm.core.utils import (
     extract_schema as extract_schema,
 )
+from localdm.core.utils import (
+    extract_schema_and_stats as extract_schema_and_stats,
+)
 from localdm.core.utils import (
     load_file as load_file,
 )
 
 __all__ = [
     "DatasetMetadata",
+    "clear_load_file_cache",
     "compute_hash",
     "compute_stats",
     "extract_schema",
+    "extract_schema_and_stats",
     "get_metadata_db_path",
     "get_object_path",
+    "get_tmp_dir",
     "init_repo",
     "load_file",
 ]
@@ -1,6 +1,6 @@
 # Standard library
 from dataclasses import dataclass
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 
 # -----------------------------
 # TypedDict Definitions
@@ -13,6 +13,11 @@ class ColumnStats(TypedDict):
     null_count: int
     null_percentage: float
     unique_count: int
+    # Only for orderable scalar dtypes, and absent on datasets saved before
+    # they were recorded. Values that JSON cannot hold (dates, decimals, ...)
+    # are stored as their string form.
+    min: NotRequired[int | float | str | None]
+    max: NotRequired[int | float | str | None]
 
 
 class DatasetStats(TypedDict):
@@ -28,7 +33,7 @@ class DatasetStats(TypedDict):
 # -----------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatasetMetadata:
     """Immutable dataset metadata."""
 
@@ -50,13 +55,33 @@ class DatasetMetadata:
         """Get preferred reference (first tag or hash)."""
         if self.tags:
             return f"{self.name}:{self.tags[0]}"
-        return f"{self.name}@{self.hash[:7]}"
+        return f"{self.name}@{self.short_hash}"
+
+    @property
+    def short_hash(self) -> str:
+        """Get abbreviated hash (first 7 characters), as used in refs."""
+        return self.hash[:7]
+
+    @property
+    def tags_display(self) -> str:
+        """Get tags as one comma-separated string (empty if untagged)."""
+        return ", ".join(self.tags)
 
     @property
     def full_ref(self) -> str:
         """Get full reference with hash."""
         return f"{self.name}@{self.hash}"
 
+    @property
+    def created_date(self) -> str:
+        """Get creation date (``YYYY-MM-DD``) from the ISO timestamp."""
+        return self.created_at[:10]
+
+    @property
+    def updated_date(self) -> str:
+        """Get last update date (``YYYY-MM-DD``) from the ISO timestamp."""
+        return self.updated_at[:10]
+
     def __repr__(self) -> str:
         tags = f"[{','.join(self.tags)}]" if self.tags else "[]"
         return f"Metadata({self.name}{tags}, id={self.id}, desc={self.description})"
@@ -14,14 +14,23 @@ def get_object_path(repo_path: Path, hash_val: str) -> Path:
 
     Example:
         hash="abc123..." -> repo_path/objects/ab/c123...parquet
+
+    The path is formatted as one string and parsed once, instead of joining
+    three ``Path`` segments.
     """
-    return repo_path / "objects" / hash_val[:2] / f"{hash_val[2:]}.parquet"
+    return Path(f"{repo_path}/objects/{hash_val[:2]}/{hash_val[2:]}.parquet")
 
 
 def init_repo(repo_path: Path) -> None:
     """Initialize repository structure."""
     repo_path.mkdir(parents=True, exist_ok=True)
     (repo_path / "objects").mkdir(exist_ok=True)
+    get_tmp_dir(repo_path).mkdir(exist_ok=True)
+
+
+def get_tmp_dir(repo_path: Path) -> Path:
+    """Get directory for in-progress writes, on the same filesystem as objects."""
+    return repo_path / "tmp"
 
 
 def get_metadata_db_path(repo_path: Path) -> Path:
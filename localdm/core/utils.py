@@ -1,7 +1,10 @@
 # Standard library
 import hashlib
-from io import BytesIO
+import io
+import math
+from collections import OrderedDict
 from pathlib import Path
+from typing import IO, Any, Final, cast
 
 # Third-party
 import polars as pl
@@ -14,6 +17,25 @@ from localdm.core.models import ColumnStats, DatasetStats
 # -----------------------------
 
 APPROX_UNIQUE_THRESHOLD = 10_000
+LOAD_FILE_CACHE_SIZE = 8
+STREAMING_READ_THRESHOLD = 256 * 1024 * 1024  # bytes
+
+# Parquet write options for stored objects. Pinned rather than left to the
+# Polars defaults: they determine the object bytes, and so the dataset hash.
+# That hash is still only stable within one Polars version: the file footer
+# records the writer's version and build (``created_by``), so upgrading Polars
+# changes the bytes, and identical frames no longer dedupe against older
+# objects.
+PARQUET_COMPRESSION: Final = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+PARQUET_ROW_GROUP_SIZE = 512 * 1024  # rows
+
+# Integer range both JSON codecs encode exactly (orjson rejects wider ints)
+JSON_INT_MIN = -(2**63)
+JSON_INT_MAX = 2**64 - 1
+
+# (path, mtime_ns, size) -> parsed frame, least recently used first
+_LOAD_FILE_CACHE: OrderedDict[tuple[str, int, int], pl.DataFrame] = OrderedDict()
 
 # -----------------------------
 # File I/O utilities
@@ -21,13 +43,53 @@ APPROX_UNIQUE_THRESHOLD = 10_000
 
 
 def load_file(path: Path) -> pl.DataFrame:
-    """Auto-detect and load file as Polars DataFrame."""
+    """Auto-detect and load file as Polars DataFrame.
+
+    Results are cached by (path, mtime, size), so reloading an unchanged file
+    skips parsing. Each caller gets its own clone of the cached frame (cheap:
+    columns are shared copy-on-write), so in-place edits such as
+    ``insert_column`` do not leak into later loads.
+    """
+    stat = path.stat()
+    key: tuple[str, int, int] = (str(path.absolute()), stat.st_mtime_ns, stat.st_size)
+
+    cached: pl.DataFrame | None = _LOAD_FILE_CACHE.get(key)
+    if cached is not None:
+        _LOAD_FILE_CACHE.move_to_end(key)
+        return cached.clone()
+
+    df: pl.DataFrame = _read_file(path, stat.st_size)
+    _LOAD_FILE_CACHE[key] = df
+    if len(_LOAD_FILE_CACHE) > LOAD_FILE_CACHE_SIZE:
+        _LOAD_FILE_CACHE.popitem(last=False)
+    return df.clone()
+
+
+def clear_load_file_cache() -> None:
+    """Drop all cached ``load_file`` results."""
+    _LOAD_FILE_CACHE.clear()
+
+
+def _read_file(path: Path, size: int) -> pl.DataFrame:
+    """Parse file with the reader matching its suffix.
+
+    Line-oriented formats above ``STREAMING_READ_THRESHOLD`` bytes are read
+    through the streaming engine to bound peak memory. Parquet is
+    memory-mapped by ``read_parquet``.
+    """
     suffix: str = path.suffix.lower()
+    streaming: bool = size > STREAMING_READ_THRESHOLD
     if suffix == ".csv":
+        if streaming:
+            return pl.scan_csv(path).collect(engine="streaming")
         return pl.read_csv(path)
     if suffix == ".parquet":
         return pl.read_parquet(path)
-    if suffix in [".json", ".jsonl"]:
+    if suffix == ".jsonl":
+        if streaming:
+            return pl.scan_ndjson(path).collect(engine="streaming")
+        return pl.read_ndjson(path)
+    if suffix == ".json":
         return pl.read_json(path)
     msg: str = f"Unsupported file type: {suffix}"
     raise ValueError(msg)
@@ -39,14 +101,26 @@ def load_file(path: Path) -> pl.DataFrame:
 
 
 def compute_hash(df: pl.DataFrame, *, full: bool = False) -> str:
-    """Compute content hash of Polars DataFrame."""
+    """Compute content hash of Polars DataFrame.
+
+    Datasets are not addressed by this hash: their hash comes from the stored
+    parquet bytes (see ``write_parquet_hashed``).
+
+    Args:
+        df: DataFrame to hash
+        full: Hash every cell instead of shape, schema and samples
+    """
     if full:
         return _compute_full_hash(df)
     return _compute_heuristic_hash(df)
 
 
 def _compute_heuristic_hash(df: pl.DataFrame) -> str:
-    """Fast hash based on metadata and samples."""
+    """Fast hash based on metadata and samples.
+
+    Cost is independent of the number of cells: only shape, schema and ten
+    sample rows are read, so no whole-frame aggregate belongs here.
+    """
     components: list[str] = []
 
     # Shape
@@ -54,34 +128,86 @@ def _compute_heuristic_hash(df: pl.DataFrame) -> str:
     components.append(f"cols:{len(df.columns)}")
 
     # Schema
-    schema: list[tuple[str, str]] = sorted(
-        (col, str(dtype)) for col, dtype in df.schema.items()
-    )
-    components.append(f"schema:{schema}")
-
-    # Helper to get parquet bytes
-    def parquet_bytes(subdf: pl.DataFrame) -> bytes:
-        buffer = BytesIO()
-        subdf.write_parquet(buffer)
-        return buffer.getvalue()
+    components.append(f"schema:{sorted(extract_schema(df).items())}")
 
-    # Sample head/tail (only 5 rows each - very cheap)
-    head_bytes: bytes = parquet_bytes(df.head(5))
-    tail_bytes: bytes = parquet_bytes(df.tail(5))
+    # Sample head/tail (only 5 rows each - very cheap). Row hashes depend on
+    # the values only, not on chunking or on what the buffers hold under a
+    # null, so equal frames sample equally however they were built.
+    sample_hasher = hashlib.sha256()
+    for sample in (df.head(5), df.tail(5)):
+        for row_hash in sample.hash_rows():
+            sample_hasher.update(row_hash.to_bytes(8, "little"))
 
-    components.append(f"head:{hashlib.sha256(head_bytes).hexdigest()[:8]}")
-    components.append(f"tail:{hashlib.sha256(tail_bytes).hexdigest()[:8]}")
+    components.append(f"sample:{sample_hasher.hexdigest()[:16]}")
 
     combined: str = "|".join(components)
     return hashlib.sha256(combined.encode()).hexdigest()
 
 
+class _HashingWriter(io.RawIOBase):
+    """Write-only file-like sink that hashes bytes as they are written.
+
+    If ``tee`` is given, every chunk is also written through to it, so one
+    serialization pass both hashes and persists the bytes.
+    """
+
+    def __init__(self, tee: IO[bytes] | None = None) -> None:
+        super().__init__()
+        self.hasher = hashlib.sha256()
+        self.tee: IO[bytes] | None = tee
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.hasher.update(data)
+        if self.tee is not None:
+            self.tee.write(data)
+        return len(data)
+
+
+def write_parquet_hashed(df: pl.DataFrame, path: Path) -> str:
+    """Write DataFrame to a parquet file and hash the bytes on the way out.
+
+    The parquet encoder writes straight into a hashing sink that tees to
+    ``path``: one encode, no in-memory copy of the file, no re-read to hash.
+    Rechunking first makes the bytes, and so the digest, independent of how
+    the frame happens to be chunked. Objects are zstd-compressed in large row
+    groups with min/max statistics, so later scans can skip row groups.
+
+    Returns:
+        SHA-256 hex digest of the file contents; the same frame only gets the
+        same digest under the same Polars version (see ``PARQUET_COMPRESSION``)
+    """
+    with path.open("wb") as f:
+        sink = _HashingWriter(tee=f)
+        df.rechunk().write_parquet(
+            cast("IO[bytes]", sink),
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            statistics=True,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+        )
+    return sink.hasher.hexdigest()
+
+
 def _compute_full_hash(df: pl.DataFrame) -> str:
-    """Full hash of entire dataframe (slow but accurate)."""
-    buffer_io = BytesIO()
-    df.write_parquet(buffer_io)
-    buffer: bytes = buffer_io.getvalue()
-    return hashlib.sha256(buffer).hexdigest()
+    """Full hash of entire dataframe (slow but accurate).
+
+    The frame is streamed as uncompressed Arrow IPC (schema message first,
+    then record batches) straight into the hasher: no Parquet encode and no
+    in-memory copy of the serialized bytes. Rechunking makes the byte stream
+    independent of how the frame happens to be chunked.
+    """
+    # pyarrow is only needed here; importing it up front would add ~20 ms to
+    # ``import localdm`` for a rarely used code path
+    import pyarrow as pa
+
+    table = df.rechunk().to_arrow()
+    sink = _HashingWriter()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.hasher.hexdigest()
 
 
 # -----------------------------
@@ -94,32 +220,110 @@ def extract_schema(df: pl.DataFrame) -> dict[str, str]:
     return {col: str(dtype) for col, dtype in df.schema.items()}
 
 
+def extract_schema_and_stats(
+    df: pl.DataFrame,
+) -> tuple[dict[str, str], DatasetStats]:
+    """Extract schema and compute statistics from one schema snapshot.
+
+    Equivalent to ``(extract_schema(df), compute_stats(df))``, but the schema
+    is resolved once for both and the frame is aggregated in a single pass.
+    """
+    schema: pl.Schema = df.schema
+    return (
+        {col: str(dtype) for col, dtype in schema.items()},
+        _compute_stats(df, schema),
+    )
+
+
 def compute_stats(df: pl.DataFrame) -> DatasetStats:
     """Compute enhanced statistics for Polars DataFrame.
 
+    All per-column aggregates run in a single ``select`` so Polars scans the
+    frame once, in parallel, instead of twice per column. Null counts need no
+    pass at all: each column keeps them with its validity bitmap. The schema
+    and row count are read once up front rather than per column. Unique
+    counts switch to ``approx_n_unique`` above ``APPROX_UNIQUE_THRESHOLD``
+    rows (nested dtypes, which it does not support, stay exact).
+
     Returns:
         DatasetStats with:
         - row_count: Total number of rows
         - column_count: Total number of columns
-        - column_stats: Per-column statistics (null %, unique count)
+        - column_stats: Per-column statistics (null %, unique count, and
+          min/max for numeric, temporal, string and boolean columns)
     """
+    return _compute_stats(df, df.schema)
+
+
+def _compute_stats(df: pl.DataFrame, schema: pl.Schema) -> DatasetStats:
+    """``compute_stats`` against an already resolved ``df.schema``."""
+    columns: list[str] = schema.names()
+    height: int = df.height
+    approx: bool = height > APPROX_UNIQUE_THRESHOLD
+
+    uniq_exprs: list[pl.Expr] = [
+        (
+            pl.col(col).approx_n_unique()
+            if approx and not dtype.is_nested()
+            else pl.col(col).n_unique()
+        ).alias(f"uniq_{i}")
+        for i, (col, dtype) in enumerate(schema.items())
+    ]
+    ranged: list[int] = [
+        i for i, dtype in enumerate(schema.values()) if _has_min_max(dtype)
+    ]
+    range_exprs: list[pl.Expr] = [
+        expr
+        for i in ranged
+        for expr in (
+            pl.col(columns[i]).min().alias(f"min_{i}"),
+            pl.col(columns[i]).max().alias(f"max_{i}"),
+        )
+    ]
+    row: tuple[Any, ...] = df.select(uniq_exprs + range_exprs).row(0) if columns else ()
+
+    n_cols: int = len(columns)
     column_stats: dict[str, ColumnStats] = {}
+    for i, series in enumerate(df.iter_columns()):
+        null_count: int = series.null_count()
+        null_pct: float = (null_count / height * 100) if height else 0.0
 
-    for col in df.columns:
-        s: pl.Series = df[col]
-
-        null_count: int = s.null_count()
-        null_pct: float = (null_count / df.height * 100) if df.height else 0.0
-        uniq: int = s.n_unique()
-
-        column_stats[col] = {
+        column_stats[series.name] = {
             "null_count": null_count,
             "null_percentage": null_pct,
-            "unique_count": uniq,
+            "unique_count": row[i],
         }
 
+    # min/max pairs follow the unique counts, in ``ranged`` order
+    for k, i in enumerate(ranged):
+        stats: ColumnStats = column_stats[columns[i]]
+        stats["min"] = _json_scalar(row[n_cols + 2 * k])
+        stats["max"] = _json_scalar(row[n_cols + 2 * k + 1])
+
     return {
-        "row_count": df.height,
-        "column_count": len(df.columns),
+        "row_count": height,
+        "column_count": n_cols,
         "column_stats": column_stats,
     }
+
+
+def _has_min_max(dtype: pl.DataType) -> bool:
+    """Whether ``compute_stats`` records a min/max for columns of this dtype."""
+    return dtype.is_numeric() or dtype.is_temporal() or dtype in (pl.String, pl.Boolean)
+
+
+def _json_scalar(value: object) -> int | float | str | None:
+    """Keep JSON-native scalars as-is; stringify dates, decimals and the like.
+
+    Values strict JSON cannot hold are normalized, so the stdlib and orjson
+    codecs store identical text: non-finite floats become None and integers
+    outside ``JSON_INT_MIN``..``JSON_INT_MAX`` (Int128 and the like) are
+    stringified.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, int):
+        return value if JSON_INT_MIN <= value <= JSON_INT_MAX else str(value)
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
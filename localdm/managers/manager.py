@@ -1,5 +1,6 @@
 # Standard library
 import os
+from functools import cached_property
 from pathlib import Path
 
 # Third-party
@@ -14,6 +15,23 @@ from localdm.services.dataset_service import DatasetService
 from localdm.services.display_service import DisplayService
 from localdm.services.lineage_service import LineageService
 
+# -----------------------------
+# Helpers
+# -----------------------------
+
+
+def _normalize_repo_path(repo_path: str | Path) -> Path:
+    """Make a repository path absolute.
+
+    ``resolve()`` stats every component, so it only runs for relative paths
+    or paths containing ``..``; absolute paths are used as given.
+    """
+    path: Path = Path(repo_path).expanduser()
+    if path.is_absolute() and ".." not in path.parts:
+        return path
+    return path.resolve()
+
+
 # -----------------------------
 # Unified Data Manager
 # -----------------------------
@@ -26,18 +44,18 @@ class DataManager:
         if repo_path is None:
             env_path: str | None = os.getenv("LOCALDM_REPO")
             if env_path:
-                self.repo_path = Path(env_path).expanduser().resolve()
+                self.repo_path = _normalize_repo_path(env_path)
             else:
                 self.repo_path = Path.cwd() / ".localdm"
         else:
-            self.repo_path = Path(repo_path).expanduser().resolve()
+            self.repo_path = _normalize_repo_path(repo_path)
 
         init_repo(self.repo_path)
-        db_path: Path = get_metadata_db_path(self.repo_path)
+        self._db_path: Path = get_metadata_db_path(self.repo_path)
 
         # Initialize repositories
         self._data_repo = DataRepository(self.repo_path)
-        self._metadata_repo = MetadataRepository(db_path)
+        self._metadata_repo = MetadataRepository(self._db_path)
         self._metadata_repo.init_database()
 
         # Initialize services
@@ -46,7 +64,11 @@ class DataManager:
             metadata_repo=self._metadata_repo,
         )
         self._lineage_service = LineageService(self._metadata_repo)
-        self._display_service = DisplayService(
+
+    @cached_property
+    def _display_service(self) -> DisplayService:
+        """Display service, built on first use of a show/tree method."""
+        return DisplayService(
             metadata_repo=self._metadata_repo,
             lineage_service=self._lineage_service,
         )
@@ -55,11 +77,24 @@ class DataManager:
     # Data Access
     # -----------------------------
 
-    def get(self, dataset_id: str) -> pl.LazyFrame:
+    def get(
+        self,
+        dataset_id: str,
+        *,
+        columns: list[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.LazyFrame:
         """Get dataset data as LazyFrame by ID.
 
+        The projection and filter are applied to the scan itself, so Polars
+        pushes them down and only reads the needed columns and row groups.
+        Without either, the whole file is prefetched into the page cache.
+
         Args:
             dataset_id: Dataset UUID
+            columns: Optional columns to read (keyword-only)
+            predicate: Optional row filter expression, applied before the
+                projection so it may use other columns (keyword-only)
 
         Returns:
             Polars LazyFrame for lazy evaluation
@@ -67,9 +102,61 @@ class DataManager:
         Examples:
             >>> meta = dm.list()[0]
             >>> df = dm.get(meta.id)
+            >>> names = dm.get(meta.id, columns=["name"])
+            >>> adults = dm.get(meta.id, predicate=pl.col("age") >= 18)
         """
         metadata: DatasetMetadata = self._metadata_repo.load(dataset_id)
-        return self._data_repo.load_data(metadata.hash)
+        lazy: pl.LazyFrame = self._data_repo.load_data(
+            metadata.hash, prefetch=columns is None and predicate is None
+        )
+        if predicate is not None:
+            lazy = lazy.filter(predicate)
+        if columns is not None:
+            lazy = lazy.select(columns)
+        return lazy
+
+    def collect_many(
+        self,
+        dataset_ids: list[str],
+        *,
+        columns: list[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> list[pl.DataFrame]:
+        """Read several datasets into memory at once.
+
+        Metadata is fetched in one query and the scans are collected together
+        with ``pl.collect_all``, which reads the parquet files in parallel on
+        the Polars thread pool instead of one after another.
+
+        Args:
+            dataset_ids: Dataset UUIDs
+            columns: Optional columns to read from each (keyword-only)
+            predicate: Optional row filter applied to each (keyword-only)
+
+        Returns:
+            DataFrames in the order of ``dataset_ids``
+
+        Raises:
+            KeyError: If any dataset is not found
+        """
+        metas: dict[str, DatasetMetadata] = {
+            meta.id: meta for meta in self._metadata_repo.load_many(dataset_ids)
+        }
+        full_read: bool = columns is None and predicate is None
+        lazies: list[pl.LazyFrame] = []
+        for dataset_id in dataset_ids:
+            if dataset_id not in metas:
+                msg = f"Dataset with ID '{dataset_id}' not found"
+                raise KeyError(msg)
+            lazy: pl.LazyFrame = self._data_repo.load_data(
+                metas[dataset_id].hash, prefetch=full_read
+            )
+            if predicate is not None:
+                lazy = lazy.filter(predicate)
+            if columns is not None:
+                lazy = lazy.select(columns)
+            lazies.append(lazy)
+        return pl.collect_all(lazies)
 
     def list_datasets(
         self,
@@ -79,7 +166,7 @@ class DataManager:
         """Get all datasets with optional filtering.
 
         Args:
-            name_filter: Optional name pattern to filter by
+            name_filter: Optional name substring, or LIKE pattern with ``%``
             tag_filter: Optional tag to filter by (exact match)
 
         Returns:
@@ -115,6 +202,9 @@ class DataManager:
 
         Returns:
             Reference string to created dataset
+
+        Raises:
+            ValueError: If the data is already stored as another dataset
         """
         dataset_metadata: DatasetMetadata = self._dataset_service.create_dataset(
             name=name,
@@ -126,6 +216,39 @@ class DataManager:
         )
         return dataset_metadata.ref
 
+    def create_datasets(
+        self,
+        datasets: dict[str, pl.DataFrame],
+        tag: str | None = None,
+        parents: list[str] | None = None,
+        description: str | None = None,
+        author: str | None = None,
+    ) -> list[str]:
+        """Create several datasets at once, committing their metadata together.
+
+        Args:
+            datasets: Mapping of dataset name to DataFrame
+            tag: Optional tag name applied to each dataset
+            parents: Optional list of parent references (strings) for each
+            description: Optional description (can be detailed, multiline text)
+            author: Optional author (defaults to current username)
+
+        Returns:
+            Reference strings to the created datasets, in input order
+
+        Raises:
+            ValueError: If two inputs have identical data, or an input's data
+                is already stored as another dataset
+        """
+        metadatas: list[DatasetMetadata] = self._dataset_service.create_datasets(
+            datasets,
+            tag=tag,
+            parent_refs=parents,
+            description=description,
+            author=author,
+        )
+        return [meta.ref for meta in metadatas]
+
     def derive_dataset(
         self,
         source_ref: str,
@@ -145,6 +268,10 @@ class DataManager:
 
         Returns:
             Reference string to derived dataset
+
+        Raises:
+            ValueError: If the data is identical to the source or is already
+                stored as another dataset
         """
         dataset_metadata: DatasetMetadata = self._dataset_service.derive_dataset(
             source_ref=source_ref,
@@ -173,6 +300,9 @@ class DataManager:
         Returns:
             Dataset ID
 
+        Raises:
+            ValueError: If the new data is already stored as another dataset
+
         Example:
             # Load, modify, update
             meta = dm.list()[0]
@@ -194,29 +324,56 @@ class DataManager:
             dataset_id: Dataset UUID
             force: Skip confirmation warnings if True (keyword-only)
         """
-        from rich.console import Console
+        self.delete_many([dataset_id], force=force)
 
-        # Load metadata
-        metadata: DatasetMetadata = self._metadata_repo.load(dataset_id)
+    def delete_many(self, dataset_ids: list[str], *, force: bool = False) -> None:
+        """Delete several datasets with safety checks.
+
+        Metadata and children are fetched in bulk and all rows go in one
+        transaction. Nothing is deleted if any dataset still has children
+        outside ``dataset_ids``, unless ``force`` is set.
 
-        # Check for children
-        children: list[DatasetMetadata] = self._metadata_repo.get_children(dataset_id)
-
-        if children and not force:
-            console = Console()
-            child_refs: list[str] = [c.ref for c in children]
-            console.print(
-                f"[yellow]Warning:[/] Dataset '{metadata.ref}' has "
-                f"{len(children)} child dataset(s):\n"
-                f"  {', '.join(child_refs)}\n"
-                f"Deleting will leave these with missing parent reference.\n"
-                f"Use force=True to delete anyway."
+        Args:
+            dataset_ids: Dataset UUIDs
+            force: Skip confirmation warnings if True (keyword-only)
+
+        Raises:
+            KeyError: If any dataset is not found
+        """
+        # Load metadata; an ID given twice is deleted once
+        ids: list[str] = list(dict.fromkeys(dataset_ids))
+        metas: list[DatasetMetadata] = self._metadata_repo.load_many(ids)
+        found: set[str] = {meta.id for meta in metas}
+        for dataset_id in ids:
+            if dataset_id not in found:
+                msg = f"Dataset with ID '{dataset_id}' not found"
+                raise KeyError(msg)
+
+        # Check for children that are not being deleted with their parent
+        if not force:
+            children: dict[str, list[DatasetMetadata]] = (
+                self._metadata_repo.get_children_many(ids)
             )
-            return
+            blocked: bool = False
+            for metadata in metas:
+                child_refs: list[str] = [
+                    c.ref for c in children[metadata.id] if c.id not in found
+                ]
+                if child_refs:
+                    blocked = True
+                    self._display_service.console.print(
+                        f"[yellow]Warning:[/] Dataset '{metadata.ref}' has "
+                        f"{len(child_refs)} child dataset(s):\n"
+                        f"  {', '.join(child_refs)}\n"
+                        f"Deleting will also remove their lineage links to it.\n"
+                        f"Use force=True to delete anyway."
+                    )
+            if blocked:
+                return
 
         # Delete data and metadata
-        self._data_repo.delete_data(metadata.hash)
-        self._metadata_repo.delete_metadata(dataset_id)
+        self._data_repo.delete_data_many([meta.hash for meta in metas])
+        self._metadata_repo.delete_metadata_many([meta.id for meta in metas])
 
     # -----------------------------
     # Metadata Operations
@@ -240,6 +397,26 @@ class DataManager:
         """
         self._metadata_repo.update_description(dataset_id, new_description)
 
+    def update_fields(
+        self,
+        dataset_id: str,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        author: str | None = None,
+    ) -> None:
+        """Update several metadata fields of a dataset at once.
+
+        Args:
+            dataset_id: Dataset UUID
+            name: New name, or None to keep it (keyword-only)
+            description: New description, or None to keep it (keyword-only)
+            author: New author, or None to keep it (keyword-only)
+        """
+        self._metadata_repo.update_fields(
+            dataset_id, name=name, description=description, author=author
+        )
+
     def add_tag(self, dataset_id: str, tag: str) -> None:
         """Add a tag to an existing dataset.
 
@@ -285,7 +462,7 @@ class DataManager:
         """Display all datasets in a rich table.
 
         Args:
-            name_filter: Optional name pattern to filter by
+            name_filter: Optional name substring, or LIKE pattern with ``%``
         """
         self._display_service.show_datasets_table(name_filter=name_filter)
 
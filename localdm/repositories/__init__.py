@@ -1,5 +1,5 @@
 # Local imports
 from localdm.repositories.data_repository import DataRepository, DatasetRepository
-from localdm.repositories.metadata_repository import MetadataRepository
+from localdm.repositories.metadata_repository import MetadataRepository, close_all
 
-__all__ = ["DataRepository", "DatasetRepository", "MetadataRepository"]
+__all__ = ["DataRepository", "DatasetRepository", "MetadataRepository", "close_all"]
@@ -1,12 +1,45 @@
 # Standard library
+import contextlib
+import os
+import uuid
+from collections import OrderedDict
 from pathlib import Path
 
 # Third-party
 import polars as pl
 
 # Local imports
-from localdm.core.models import DatasetMetadata
-from localdm.core.storage import get_object_path
+from localdm.core.storage import get_object_path, get_tmp_dir
+from localdm.core.utils import write_parquet_hashed
+
+# -----------------------------
+# Constants
+# -----------------------------
+
+SCAN_CACHE_SIZE = 256
+
+# Object path -> LazyFrame over it, least recently used first. Shared by all
+# repositories in the process; objects are content-addressed, so a scan stays
+# valid until the object is rewritten or deleted.
+_SCAN_CACHE: OrderedDict[str, pl.LazyFrame] = OrderedDict()
+
+
+def _prefetch(path: Path) -> None:
+    """Ask the kernel to start reading a file into the page cache.
+
+    Readahead then overlaps with whatever the caller does before collecting,
+    instead of the first collect demand-paging the file. A no-op where
+    ``posix_fadvise`` is unavailable (macOS, Windows) or the file is missing.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with contextlib.suppress(OSError):
+        fd: int = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
 
 # -----------------------------
 # Data Repository
@@ -18,30 +51,83 @@ class DataRepository:
 
     def __init__(self, repo_path: Path) -> None:
         self.repo_path: Path = repo_path
+        self._tmp_dir: Path = get_tmp_dir(repo_path)
 
-    def save_data(self, data: pl.DataFrame, metadata: DatasetMetadata) -> None:
-        """Save DataFrame to parquet file.
+    def save_data(self, data: pl.DataFrame) -> str:
+        """Save DataFrame to its content-addressed parquet file.
+
+        See ``store_data``.
 
         Args:
             data: DataFrame to save
-            metadata: Metadata containing hash for file path
+
+        Returns:
+            Content hash (SHA-256 of the parquet file)
         """
-        hash_val: str = metadata.hash
-        data_path: Path = get_object_path(self.repo_path, hash_val)
-        data_path.parent.mkdir(parents=True, exist_ok=True)
-        data.write_parquet(data_path)
+        hash_val, _ = self.store_data(data)
+        return hash_val
+
+    def store_data(self, data: pl.DataFrame) -> tuple[str, bool]:
+        """Save DataFrame and report whether its object is new.
 
-    def load_data(self, hash_val: str) -> pl.LazyFrame:
+        The parquet bytes are hashed while they are written, so the data is
+        encoded once and never hashed in a separate pass. The file is written
+        to ``tmp/`` and atomically renamed to its address once the hash is
+        known; if that address already exists the content is already stored
+        and the temporary file is discarded.
+
+        Args:
+            data: DataFrame to save
+
+        Returns:
+            Content hash (SHA-256 of the parquet file), and whether this call
+            created the object (so a failed save can remove it again)
+        """
+        tmp_path: Path = self._tmp_dir / f"{uuid.uuid4().hex}.parquet"
+        created: bool = False
+        try:
+            hash_val: str = write_parquet_hashed(data, tmp_path)
+            data_path: Path = get_object_path(self.repo_path, hash_val)
+            if not data_path.exists():
+                data_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.replace(data_path)
+                created = True
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return hash_val, created
+
+    def load_data(self, hash_val: str, *, prefetch: bool = False) -> pl.LazyFrame:
         """Load DataFrame from parquet file.
 
         Args:
             hash_val: Dataset hash
+            prefetch: Ask the kernel to read the whole file into the page
+                cache; only worth it when the caller will read every column
+                and row group (keyword-only)
 
         Returns:
             LazyFrame for lazy evaluation
+
+        Note:
+            Scans are kept in a process-wide LRU of ``SCAN_CACHE_SIZE``
+            entries, so repeated loads reuse the same plan (and the parquet
+            footer Polars resolved for it) across DataManager instances.
         """
         data_path: Path = get_object_path(self.repo_path, hash_val)
-        return pl.scan_parquet(data_path)
+        key: str = str(data_path)
+        if prefetch:
+            _prefetch(data_path)
+
+        scan: pl.LazyFrame | None = _SCAN_CACHE.get(key)
+        if scan is not None:
+            _SCAN_CACHE.move_to_end(key)
+            return scan
+
+        scan = pl.scan_parquet(data_path)
+        _SCAN_CACHE[key] = scan
+        if len(_SCAN_CACHE) > SCAN_CACHE_SIZE:
+            _SCAN_CACHE.popitem(last=False)
+        return scan
 
     def delete_data(self, hash_val: str) -> None:
         """Delete parquet file.
@@ -50,9 +136,21 @@ class DataRepository:
             hash_val: Dataset hash
         """
         data_path: Path = get_object_path(self.repo_path, hash_val)
+        _SCAN_CACHE.pop(str(data_path), None)
         if data_path.exists():
             data_path.unlink()
 
+    def delete_data_many(self, hash_vals: list[str]) -> None:
+        """Delete several parquet files.
+
+        Args:
+            hash_vals: Dataset hashes
+        """
+        for hash_val in hash_vals:
+            data_path: Path = get_object_path(self.repo_path, hash_val)
+            _SCAN_CACHE.pop(str(data_path), None)
+            data_path.unlink(missing_ok=True)
+
     def data_exists(self, hash_val: str) -> bool:
         """Check if parquet file exists.
 
@@ -1,17 +1,51 @@
 # Standard library
+import atexit
+import contextlib
+import importlib
 import json
+import os
 import sqlite3
+import sys
+import threading
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 # Local imports
 from localdm.core.models import DatasetMetadata
 from localdm.repositories.schemas import (
-    SQL_CREATE_DATASETS,
-    SQL_CREATE_INDEXES,
-    SQL_CREATE_LINEAGE,
-    SQL_CREATE_TAGS,
+    SQL_ADD_TAG,
+    SQL_CONNECTION_PRAGMAS,
+    SQL_DELETE_DATASET,
+    SQL_DELETE_DATASETS,
+    SQL_HAS_STATS,
+    SQL_INIT_SCHEMA,
+    SQL_INSERT_DATASET,
+    SQL_INSERT_LINEAGE,
+    SQL_INSERT_TAG,
+    SQL_LIST_ALL_REFS,
+    SQL_LIST_DATASETS,
+    SQL_LIST_DATASETS_BY_TAG,
+    SQL_LIST_TAGS,
+    SQL_MOVE_TAG,
+    SQL_REMOVE_TAG,
+    SQL_SELECT_ANCESTORS,
+    SQL_SELECT_ANCESTORS_TO_DEPTH,
+    SQL_SELECT_CHILD_EDGES,
+    SQL_SELECT_DATASET,
+    SQL_SELECT_DATASETS,
+    SQL_SELECT_ID_BY_HASH,
+    SQL_SELECT_ID_BY_ID,
+    SQL_SELECT_ID_BY_TAG,
+    SQL_SELECT_IDS_BY_HASHES,
+    SQL_SELECT_IDS_BY_IDS,
+    SQL_SELECT_IDS_BY_TAGS,
+    SQL_SELECT_NAME,
+    SQL_UPDATE_FIELDS,
 )
 
 # -----------------------------
@@ -19,6 +53,224 @@ from localdm.repositories.schemas import (
 # -----------------------------
 
 UUID_STRING_LENGTH = 36
+CACHED_STATEMENTS = 256
+METADATA_CACHE_SIZE = 1024
+SCHEMA_CACHE_SIZE = 256
+
+# Reused codec for schema/stats columns; compact separators keep rows small.
+# Strict JSON only, so rows read the same with orjson. Rows written before
+# stats were normalized may hold NaN/Infinity; they decode as None, which is
+# what ``_json_scalar`` now stores for non-finite values.
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), allow_nan=False)
+_JSON_DECODER = json.JSONDecoder(parse_constant=lambda _: None)
+
+# orjson, if installed (``localdm[fast]``), encodes and decodes the stats
+# blobs several times faster; its output is compact JSON text like the above.
+try:
+    _orjson: Any = importlib.import_module("orjson")
+except ImportError:
+    _orjson = None
+
+
+def _orjson_dumps(obj: object) -> str:
+    """Encode with orjson, as text for the SQLite TEXT columns."""
+    dumped: bytes = _orjson.dumps(obj)
+    return dumped.decode()
+
+
+def _orjson_loads(text: str) -> Any:
+    """Decode with orjson, falling back to the stdlib decoder.
+
+    orjson rejects the ``NaN``/``Infinity`` that older rows may contain.
+    """
+    try:
+        return _orjson.loads(text)
+    except ValueError:
+        return _JSON_DECODER.decode(text)
+
+
+_json_dumps: Callable[[object], str] = (
+    _orjson_dumps if _orjson is not None else _JSON_ENCODER.encode
+)
+_json_loads: Callable[[str], Any] = (
+    _orjson_loads if _orjson is not None else _JSON_DECODER.decode
+)
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _parse_schema(schema_json: str) -> dict[str, str]:
+    """Parse a stored schema; the result is shared, so only copies leave here."""
+    schema: dict[str, str] = _json_loads(schema_json)
+    return schema
+
+
+def _decode_schema(schema_json: str) -> dict[str, str]:
+    """Decode a stored schema into a dict the caller owns.
+
+    Derived datasets usually share a schema, so each distinct schema is parsed
+    once (``SCHEMA_CACHE_SIZE`` most recent kept) and then only copied.
+    """
+    return dict(_parse_schema(schema_json))
+
+
+# -----------------------------
+# Connection Cache
+# -----------------------------
+
+_CONN_CACHE: dict[tuple[Path, int], sqlite3.Connection] = {}
+_CONN_LOCK = threading.Lock()
+
+# Connections a forked child inherited from its parent. SQLite handles must not
+# be used across fork(), nor closed in the child (closing can checkpoint the
+# WAL the parent is using), so they are only kept alive here.
+_INHERITED_CONNS: list[sqlite3.Connection] = []
+
+
+def _forget_connections_after_fork() -> None:
+    """In a forked child, stop handing out the parent's connections."""
+    _INHERITED_CONNS.extend(_CONN_CACHE.values())
+    _CONN_CACHE.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_connections_after_fork)
+
+
+def _get_conn(db_path: Path) -> sqlite3.Connection:
+    """Get the cached connection for this database and thread.
+
+    The connection is opened on first use and tuned once with
+    ``SQL_CONNECTION_PRAGMAS``; pragmas such as ``synchronous`` and
+    ``cache_size`` only live as long as the connection that set them. A
+    forked child starts with an empty cache and opens its own connections.
+    """
+    key: tuple[Path, int] = (db_path, threading.get_ident())
+    conn: sqlite3.Connection | None = _CONN_CACHE.get(key)
+    if conn is None:
+        conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=CACHED_STATEMENTS
+        )
+        conn.executescript(SQL_CONNECTION_PRAGMAS)
+        with _CONN_LOCK:
+            _CONN_CACHE[key] = conn
+    return conn
+
+
+def close_all() -> None:
+    """Close every cached connection (e.g. on test teardown).
+
+    Runs ``PRAGMA optimize`` first so planner statistics stay current for
+    tables whose size changed while the connection was open. The parsed
+    schema cache is dropped too.
+    """
+    with _CONN_LOCK:
+        conns: list[sqlite3.Connection] = list(_CONN_CACHE.values())
+        _CONN_CACHE.clear()
+    _parse_schema.cache_clear()
+    for conn in conns:
+        with contextlib.suppress(sqlite3.Error):
+            conn.execute("PRAGMA optimize")
+        conn.close()
+
+
+atexit.register(close_all)
+
+
+def _is_uuid(ref: str) -> bool:
+    """Whether a reference is a dataset ID (canonical 36-character UUID).
+
+    The length test rejects almost every ``name:tag``/``name@hash`` reference
+    before ``uuid.UUID`` parses anything, and the parse keeps a 36-character
+    reference that merely contains dashes from being taken for an ID.
+    """
+    if len(ref) != UUID_STRING_LENGTH:
+        return False
+    try:
+        uuid.UUID(ref)
+    except ValueError:
+        return False
+    return True
+
+
+def _data_token(conn: sqlite3.Connection) -> tuple[int, int]:
+    """Snapshot of the database's write state as seen from ``conn``.
+
+    ``data_version`` changes when any other connection (thread or process)
+    commits; ``total_changes`` counts this connection's own writes.
+    """
+    return conn.execute("PRAGMA data_version").fetchone()[0], conn.total_changes
+
+
+def _parse_ref(ref: str) -> tuple[str, str]:
+    """Split a reference into its kind ("id", "hash" or "tag") and lookup key."""
+    if _is_uuid(ref):
+        return "id", ref
+    if "@" in ref:
+        return "hash", ref.split("@", 1)[1]
+    if ":" in ref:
+        return "tag", ref
+    msg = f"Invalid reference '{ref}'. Use 'name:tag', 'name@hash', or ID format."
+    raise ValueError(msg)
+
+
+def _name_pattern(name_filter: str | None) -> str | None:
+    """Turn a ``list_datasets`` name filter into a LIKE pattern.
+
+    A filter containing ``%`` is already a pattern and is used as given, so
+    callers can anchor it (``"sales%"``); anything else matches as a
+    substring, as before.
+    """
+    if not name_filter:
+        return None
+    if "%" in name_filter:
+        return name_filter
+    return f"%{name_filter}%"
+
+
+def _ref_not_found_message(kind: str, key: str) -> str:
+    """Build the KeyError message for an unresolved reference."""
+    if kind == "id":
+        return f"Dataset with ID '{key}' not found"
+    if kind == "hash":
+        return f"Dataset with hash '{key}' not found"
+    name, tag = key.split(":", 1)
+    return f"Tag '{tag}' not found for dataset '{name}'"
+
+
+def _row_to_metadata(row: Any) -> DatasetMetadata:
+    """Build DatasetMetadata from a ``SQL_SELECT_DATASET(S)`` row."""
+    (
+        id_val,
+        hash_val,
+        name,
+        created_at,
+        updated_at,
+        author,
+        data_path,
+        description,
+        schema_json,
+        stats_json,
+        tags_json,
+        parents_json,
+    ) = row
+    tags: list[str] = _json_loads(tags_json)
+    parent_ids: list[str] = _json_loads(parents_json)
+
+    return DatasetMetadata(
+        id=id_val,
+        hash=hash_val,
+        name=name,
+        tags=tags,
+        created_at=created_at,
+        updated_at=updated_at,
+        author=sys.intern(author),
+        parent_refs=parent_ids,
+        description=description,
+        schema=_decode_schema(schema_json) if schema_json else None,
+        stats=_json_loads(stats_json) if stats_json else None,
+        data_path=data_path,
+    )
+
 
 # -----------------------------
 # Metadata Repository
@@ -30,6 +282,41 @@ class MetadataRepository:
 
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
+        # ID -> metadata and ref -> ID, least recently used first. Both are
+        # valid for one _cache_token; any commit changes the token.
+        self._meta_cache: OrderedDict[str, DatasetMetadata] = OrderedDict()
+        self._ref_cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_token: tuple[int, int] | None = None
+
+    # -----------------------------
+    # Read Cache
+    # -----------------------------
+
+    def _check_cache(self, conn: sqlite3.Connection) -> None:
+        """Drop cached reads if the database changed since they were made.
+
+        See ``_data_token``. A file mtime would not do: in WAL mode commits
+        land in the -wal file.
+        """
+        token: tuple[int, int] = _data_token(conn)
+        if token != self._cache_token:
+            self._meta_cache.clear()
+            self._ref_cache.clear()
+            self._cache_token = token
+
+    def version(self) -> tuple[int, int]:
+        """Token that changes whenever the database has been written.
+
+        Lets callers keep structures derived from metadata (such as the
+        lineage index) until the next commit, like the read cache here.
+        """
+        return _data_token(_get_conn(self.db_path))
+
+    @staticmethod
+    def _cache_put[V](cache: OrderedDict[str, V], key: str, value: V) -> None:
+        cache[key] = value
+        if len(cache) > METADATA_CACHE_SIZE:
+            cache.popitem(last=False)
 
     # -----------------------------
     # Database Initialization
@@ -39,69 +326,82 @@ class MetadataRepository:
         """Initialize SQLite database with schema."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
+        conn: sqlite3.Connection = _get_conn(self.db_path)
         try:
-            conn.execute(SQL_CREATE_DATASETS)
-            conn.execute(SQL_CREATE_LINEAGE)
-            conn.execute(SQL_CREATE_TAGS)
-            conn.executescript(SQL_CREATE_INDEXES)
-            conn.commit()
-        finally:
-            conn.close()
+            conn.executescript(SQL_INIT_SCHEMA)
+        except sqlite3.Error:
+            # A failed script leaves its BEGIN open
+            conn.rollback()
+            raise
+
+        # Gather planner statistics once; close_all() keeps them fresh
+        if not conn.execute(SQL_HAS_STATS).fetchone():
+            with conn:
+                conn.execute("ANALYZE")
 
     # -----------------------------
     # CRUD Operations
     # -----------------------------
 
     def save(self, metadata: DatasetMetadata) -> None:
-        """Save dataset metadata to database."""
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            # Save dataset
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO datasets
-                (id, hash, name, created_at, updated_at, author, data_path,
-                 description, schema_json, stats_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    metadata.id,
-                    metadata.hash,
-                    metadata.name,
-                    metadata.created_at,
-                    metadata.updated_at,
-                    metadata.author,
-                    metadata.data_path,
-                    metadata.description,
-                    json.dumps(metadata.schema) if metadata.schema else None,
-                    json.dumps(metadata.stats) if metadata.stats else None,
-                ),
-            )
+        """Save dataset metadata, tags, and lineage in a single transaction."""
+        self.save_many([metadata])
 
-            # Save tags
-            for tag in metadata.tags:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO tags (name, tag, dataset_id, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (metadata.name, tag, metadata.id, metadata.created_at),
-                )
+    def save_many(self, metadatas: list[DatasetMetadata]) -> None:
+        """Save metadata, tags, and lineage for several datasets.
 
-            # Save lineage (parent_refs are now IDs)
-            for parent_id in metadata.parent_refs:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO lineage (child_id, parent_id)
-                    VALUES (?, ?)
-                    """,
-                    (metadata.id, parent_id),
-                )
+        All rows go in one transaction (one commit, one WAL sync), with one
+        ``executemany`` per statement that has rows to write.
 
-            conn.commit()
-        finally:
-            conn.close()
+        Raises:
+            ValueError: If a dataset's hash is already stored under another ID,
+                or a parent ID has no dataset row; nothing is written
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        try:
+            with conn:
+                self._insert_many(conn, metadatas)
+        except sqlite3.IntegrityError as e:
+            msg = f"Cannot save dataset metadata: {e}"
+            raise ValueError(msg) from e
+
+    @staticmethod
+    def _insert_many(
+        conn: sqlite3.Connection, metadatas: list[DatasetMetadata]
+    ) -> None:
+        """Write the rows for ``save_many`` inside the caller's transaction."""
+        # Save datasets
+        conn.executemany(
+            SQL_INSERT_DATASET,
+            [
+                (
+                    m.id,
+                    m.hash,
+                    m.name,
+                    m.created_at,
+                    m.updated_at,
+                    m.author,
+                    m.data_path,
+                    m.description,
+                    _json_dumps(m.schema) if m.schema else None,
+                    _json_dumps(m.stats) if m.stats else None,
+                )
+                for m in metadatas
+            ],
+        )
+
+        # Save tags and lineage (parent_refs are now IDs); untagged roots
+        # have neither, so those statements are skipped entirely
+        tag_rows: list[tuple[str, str, str, str]] = [
+            (m.name, tag, m.id, m.created_at) for m in metadatas for tag in m.tags
+        ]
+        if tag_rows:
+            conn.executemany(SQL_INSERT_TAG, tag_rows)
+        lineage_rows: list[tuple[str, str]] = [
+            (m.id, parent_id) for m in metadatas for parent_id in m.parent_refs
+        ]
+        if lineage_rows:
+            conn.executemany(SQL_INSERT_LINEAGE, lineage_rows)
 
     def generate_id(self) -> str:
         """Generate a new unique dataset ID.
@@ -122,75 +422,81 @@ class MetadataRepository:
 
         Raises:
             KeyError: If dataset not found
+
+        Note:
+            Results are cached until the next commit to the database, so the
+            returned metadata is shared and must be treated as read-only.
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            # Load dataset
-            cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT id, hash, name, created_at, updated_at, author, data_path,
-                       description, schema_json, stats_json
-                FROM datasets
-                WHERE id = ?
-                """,
-                (dataset_id,),
-            )
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        self._check_cache(conn)
+        cached: DatasetMetadata | None = self._meta_cache.get(dataset_id)
+        if cached is not None:
+            self._meta_cache.move_to_end(dataset_id)
+            return cached
 
-            row: Any = cursor.fetchone()
-            if not row:
-                msg = f"Dataset with ID '{dataset_id}' not found"
-                raise KeyError(msg)
+        # Load dataset with its tags and parent IDs in one statement
+        cursor: sqlite3.Cursor = conn.execute(SQL_SELECT_DATASET, (dataset_id,))
 
-            (
-                id_val,
-                hash_val,
-                name,
-                created_at,
-                updated_at,
-                author,
-                data_path,
-                description,
-                schema_json,
-                stats_json,
-            ) = row
-
-            # Load tags
-            tags_cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT tag FROM tags
-                WHERE dataset_id = ?
-                ORDER BY created_at
-                """,
-                (dataset_id,),
-            )
-            tags: list[Any] = [row[0] for row in tags_cursor.fetchall()]
-
-            # Load parent IDs
-            parents_cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT parent_id FROM lineage
-                WHERE child_id = ?
-                """,
-                (dataset_id,),
-            )
-            parent_ids: list[Any] = [row[0] for row in parents_cursor.fetchall()]
-
-            return DatasetMetadata(
-                id=id_val,
-                hash=hash_val,
-                name=name,
-                tags=tags,
-                created_at=created_at,
-                updated_at=updated_at,
-                author=author,
-                parent_refs=parent_ids,
-                description=description,
-                schema=json.loads(schema_json) if schema_json else None,
-                stats=json.loads(stats_json) if stats_json else None,
-                data_path=data_path,
-            )
-        finally:
-            conn.close()
+        row: Any = cursor.fetchone()
+        if not row:
+            msg = f"Dataset with ID '{dataset_id}' not found"
+            raise KeyError(msg)
+
+        metadata: DatasetMetadata = _row_to_metadata(row)
+        self._cache_put(self._meta_cache, dataset_id, metadata)
+        return metadata
+
+    def load_many(self, dataset_ids: list[str]) -> list[DatasetMetadata]:
+        """Load metadata for several datasets in one query.
+
+        Args:
+            dataset_ids: Dataset UUIDs
+
+        Returns:
+            DatasetMetadata in input order; unknown IDs are skipped
+        """
+        if not dataset_ids:
+            return []
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        by_id: dict[str, DatasetMetadata] = {
+            row[0]: _row_to_metadata(row)
+            for row in conn.execute(SQL_SELECT_DATASETS, (_json_dumps(dataset_ids),))
+        }
+        return [by_id[i] for i in dataset_ids if i in by_id]
+
+    def find_by_hash(self, hash_val: str) -> DatasetMetadata | None:
+        """Load the dataset stored under a content hash, if any.
+
+        Args:
+            hash_val: Full content hash
+
+        Returns:
+            DatasetMetadata, or None if no dataset has this hash
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        row: Any = conn.execute(SQL_SELECT_ID_BY_HASH, (hash_val,)).fetchone()
+        return self.load(row[0]) if row else None
+
+    def get_ancestors(
+        self, dataset_id: str, max_depth: int | None = None
+    ) -> dict[str, DatasetMetadata]:
+        """Load the transitive parents of a dataset in one recursive query.
+
+        Args:
+            dataset_id: Dataset UUID
+            max_depth: Optional limit on parent links followed (1 = parents)
+
+        Returns:
+            Mapping of ancestor ID to metadata (the dataset itself excluded);
+            parent IDs with no dataset row are absent
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        cursor: sqlite3.Cursor = (
+            conn.execute(SQL_SELECT_ANCESTORS, (dataset_id,))
+            if max_depth is None
+            else conn.execute(SQL_SELECT_ANCESTORS_TO_DEPTH, (dataset_id, max_depth))
+        )
+        return {row[0]: _row_to_metadata(row) for row in cursor}
 
     def resolve_ref_to_id(self, ref: str) -> str:
         """Resolve dataset reference to ID.
@@ -205,75 +511,89 @@ class MetadataRepository:
             KeyError: If reference not found
             ValueError: If reference format invalid
         """
-        # If it looks like a UUID, use it directly
-        if "-" in ref and len(ref) == UUID_STRING_LENGTH:
-            # Validate it exists
-            conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-            try:
-                cursor: sqlite3.Cursor = conn.execute(
-                    "SELECT id FROM datasets WHERE id = ?",
-                    (ref,),
-                )
-                if cursor.fetchone():
-                    return ref
-            finally:
-                conn.close()
-
-        if "@" in ref:
-            # Hash reference
-            _, hash_val = ref.split("@", 1)
-            conn = sqlite3.connect(self.db_path)
-            try:
-                cursor = conn.execute(
-                    "SELECT id FROM datasets WHERE hash = ?",
-                    (hash_val,),
-                )
-                row: Any = cursor.fetchone()
-                if not row:
-                    msg = f"Dataset with hash '{hash_val}' not found"
-                    raise KeyError(msg)
-                dataset_id_result: str = row[0]
-                return dataset_id_result
-            finally:
-                conn.close()
-
-        if ":" in ref:
-            # Tag reference
-            name, tag = ref.split(":", 1)
-            conn = sqlite3.connect(self.db_path)
-            try:
-                cursor = conn.execute(
-                    """
-                    SELECT dataset_id FROM tags
-                    WHERE name = ? AND tag = ?
-                    """,
-                    (name, tag),
-                )
-                row = cursor.fetchone()
-                if not row:
-                    msg = f"Tag '{tag}' not found for dataset '{name}'"
-                    raise KeyError(msg)
-                tag_dataset_id: str = row[0]
-                return tag_dataset_id
-            finally:
-                conn.close()
-
-        msg = f"Invalid reference '{ref}'. Use 'name:tag', 'name@hash', or ID format."
-        raise ValueError(msg)
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        self._check_cache(conn)
+        cached: str | None = self._ref_cache.get(ref)
+        if cached is not None:
+            self._ref_cache.move_to_end(ref)
+            return cached
+
+        dataset_id: str = self._resolve_ref(conn, ref)
+        self._cache_put(self._ref_cache, ref, dataset_id)
+        return dataset_id
+
+    def _resolve_ref(self, conn: sqlite3.Connection, ref: str) -> str:
+        """Resolve one reference against the database, bypassing the cache."""
+        kind, key = _parse_ref(ref)
+        row: Any
+        if kind == "id":
+            row = conn.execute(SQL_SELECT_ID_BY_ID, (key,)).fetchone()
+        elif kind == "hash":
+            row = conn.execute(SQL_SELECT_ID_BY_HASH, (key,)).fetchone()
+        else:
+            row = conn.execute(SQL_SELECT_ID_BY_TAG, key.split(":", 1)).fetchone()
+        if not row:
+            raise KeyError(_ref_not_found_message(kind, key))
+        dataset_id: str = row[0]
+        return dataset_id
+
+    def resolve_refs_to_ids(self, refs: list[str]) -> list[str]:
+        """Resolve several dataset references to IDs at once.
+
+        Refs are grouped by kind (UUID, name@hash, name:tag) and each group is
+        resolved with one query over a JSON array, instead of one query per ref.
 
-    def list_all_refs(self) -> list[str]:
-        """List all dataset references in database."""
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
+        Args:
+            refs: References in format name:tag, name@hash, or UUID
+
+        Returns:
+            Dataset IDs (UUIDs), in the same order as ``refs``
+
+        Raises:
+            KeyError: If a reference is not found
+            ValueError: If a reference format is invalid
+        """
+        parsed: list[tuple[str, str]] = [_parse_ref(ref) for ref in refs]
+        keys: dict[str, list[str]] = {"id": [], "hash": [], "tag": []}
+        for kind, key in parsed:
+            keys[kind].append(key)
+
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        found: dict[tuple[str, str], str] = {}
+        if keys["id"]:
             cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT DISTINCT name, tag, hash FROM tags
-                ORDER BY name, tag
-                """
+                SQL_SELECT_IDS_BY_IDS, (_json_dumps(keys["id"]),)
+            )
+            found.update((("id", row[0]), row[0]) for row in cursor)
+        if keys["hash"]:
+            cursor = conn.execute(
+                SQL_SELECT_IDS_BY_HASHES, (_json_dumps(keys["hash"]),)
+            )
+            found.update((("hash", hash_val), id_val) for hash_val, id_val in cursor)
+        if keys["tag"]:
+            name_tags: list[list[str]] = [key.split(":", 1) for key in keys["tag"]]
+            cursor = conn.execute(SQL_SELECT_IDS_BY_TAGS, (_json_dumps(name_tags),))
+            found.update(
+                (("tag", f"{name}:{tag}"), id_val) for name, tag, id_val in cursor
             )
-            return [f"{name}:{tag}" for name, tag, _ in cursor.fetchall()]
-        finally:
-            conn.close()
+
+        resolved: list[str] = []
+        for kind, key in parsed:
+            if (kind, key) not in found:
+                raise KeyError(_ref_not_found_message(kind, key))
+            resolved.append(found[kind, key])
+        return resolved
+
+    def list_all_refs(self) -> list[str]:
+        """List all dataset references in database.
+
+        The (name, tag) primary key already makes rows unique and ordered, so
+        the scan walks the index; SQLite builds each ``name:tag`` string and
+        rows are consumed straight off the cursor.
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        cursor: sqlite3.Cursor = conn.execute(SQL_LIST_ALL_REFS)
+        return [ref for (ref,) in cursor]
 
     # -----------------------------
     # Dataset Listing & Filtering
@@ -288,75 +608,69 @@ class MetadataRepository:
         """List datasets with optional filtering.
 
         Args:
-            name_filter: Optional name pattern to filter by (SQL LIKE pattern)
+            name_filter: Optional name substring, or SQL LIKE pattern if it
+                contains ``%``
             tag_filter: Optional tag to filter by (exact match)
             limit: Optional maximum number of results
 
         Returns:
             List of DatasetMetadata, ordered by creation time (newest first)
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            if tag_filter:
-                # Join with tags table if filtering by tag
-                query: str = """
-                    SELECT DISTINCT d.id
-                    FROM datasets d
-                    INNER JOIN tags t ON d.id = t.dataset_id
-                    WHERE t.tag = ?
-                """
-                params: list[str | int] = [tag_filter]
-
-                if name_filter:
-                    query += " AND d.name LIKE ?"
-                    params.append(f"%{name_filter}%")
-
-                query += " ORDER BY d.created_at DESC"
-            else:
-                query = "SELECT DISTINCT id FROM datasets WHERE 1=1"
-                params = []
-
-                if name_filter:
-                    query += " AND name LIKE ?"
-                    params.append(f"%{name_filter}%")
-
-                query += " ORDER BY created_at DESC"
-
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
-
-            cursor: sqlite3.Cursor = conn.execute(query, params)
-            dataset_ids: list[str] = [row[0] for row in cursor.fetchall()]
-
-            return [self.load(dataset_id) for dataset_id in dataset_ids]
-        finally:
-            conn.close()
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        pattern: str | None = _name_pattern(name_filter)
+        max_rows: int = limit or -1
+
+        # One statement returns complete rows; no per-dataset follow-up query
+        cursor: sqlite3.Cursor = (
+            conn.execute(SQL_LIST_DATASETS_BY_TAG, (tag_filter, pattern, max_rows))
+            if tag_filter
+            else conn.execute(SQL_LIST_DATASETS, (pattern, max_rows))
+        )
+        return [_row_to_metadata(row) for row in cursor]
 
     # -----------------------------
-    # Name update
+    # Field updates
     # -----------------------------
 
-    def update_name(self, dataset_id: str, new_name: str) -> None:
-        """Update dataset name.
+    def update_fields(
+        self,
+        dataset_id: str,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        author: str | None = None,
+    ) -> None:
+        """Update any subset of a dataset's editable fields in one statement.
+
+        ``updated_at`` is bumped in the same statement.
 
         Args:
             dataset_id: Dataset UUID
-            new_name: New dataset name
+            name: New dataset name, or None to keep it (keyword-only)
+            description: New description, or None to keep it (keyword-only)
+            author: New author, or None to keep it (keyword-only)
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
             conn.execute(
-                "UPDATE datasets SET name = ? WHERE id = ?",
-                (new_name, dataset_id),
+                SQL_UPDATE_FIELDS,
+                (
+                    dataset_id,
+                    name,
+                    description,
+                    author,
+                    datetime.now(UTC).isoformat(),
+                ),
             )
-            conn.commit()
-        finally:
-            conn.close()
 
-    # -----------------------------
-    # Description update
-    # -----------------------------
+    def update_name(self, dataset_id: str, new_name: str) -> None:
+        """Update dataset name.
+
+        Args:
+            dataset_id: Dataset UUID
+            new_name: New dataset name
+        """
+        self.update_fields(dataset_id, name=new_name)
 
     def update_description(self, dataset_id: str, new_description: str) -> None:
         """Update dataset description.
@@ -365,15 +679,7 @@ class MetadataRepository:
             dataset_id: Dataset UUID
             new_description: New description text
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                "UPDATE datasets SET description = ? WHERE id = ?",
-                (new_description, dataset_id),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self.update_fields(dataset_id, description=new_description)
 
     # -----------------------------
     # Tag Operations
@@ -389,39 +695,46 @@ class MetadataRepository:
         Raises:
             KeyError: If dataset not found
         """
-        from datetime import UTC, datetime
-
-        # Get dataset name
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
             cursor: sqlite3.Cursor = conn.execute(
-                "SELECT name FROM datasets WHERE id = ?", (dataset_id,)
+                SQL_ADD_TAG, (dataset_id, tag, datetime.now(UTC).isoformat())
             )
-            row: Any = cursor.fetchone()
-            if not row:
+            # Nothing inserted: either the tag already exists (nothing to do)
+            # or there is no such dataset
+            if (
+                not cursor.rowcount
+                and not conn.execute(SQL_SELECT_NAME, (dataset_id,)).fetchone()
+            ):
                 msg = f"Dataset with ID '{dataset_id}' not found"
                 raise KeyError(msg)
 
-            name: str = row[0]
+    def move_tag(self, dataset_id: str, tag: str) -> None:
+        """Point a tag at a dataset, moving it off another version if needed.
 
-            # Check if tag already exists
-            existing: sqlite3.Cursor = conn.execute(
-                "SELECT 1 FROM tags WHERE name = ? AND tag = ?", (name, tag)
-            )
-            if existing.fetchone():
-                return  # Tag already exists, nothing to do
+        Unlike ``add_tag``, a ``name:tag`` that refers to another dataset of
+        the same name is moved here, as saving a new version does.
 
-            # Insert new tag
-            conn.execute(
-                """
-                INSERT INTO tags (name, tag, dataset_id, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (name, tag, dataset_id, datetime.now(UTC).isoformat()),
+        Args:
+            dataset_id: Dataset UUID
+            tag: Tag name to set
+
+        Raises:
+            KeyError: If dataset not found
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
+            cursor: sqlite3.Cursor = conn.execute(
+                SQL_MOVE_TAG, (dataset_id, tag, datetime.now(UTC).isoformat())
             )
-            conn.commit()
-        finally:
-            conn.close()
+            # Nothing written: either the tag is already here or there is no
+            # such dataset
+            if (
+                not cursor.rowcount
+                and not conn.execute(SQL_SELECT_NAME, (dataset_id,)).fetchone()
+            ):
+                msg = f"Dataset with ID '{dataset_id}' not found"
+                raise KeyError(msg)
 
     def remove_tag(self, dataset_id: str, tag: str) -> None:
         """Remove a tag from a dataset.
@@ -433,33 +746,18 @@ class MetadataRepository:
         Raises:
             KeyError: If dataset or tag not found
         """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
+            if conn.execute(SQL_REMOVE_TAG, (dataset_id, tag)).fetchone():
+                return
 
-        # Get dataset name
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            cursor: sqlite3.Cursor = conn.execute(
-                "SELECT name FROM datasets WHERE id = ?", (dataset_id,)
-            )
-            row: Any = cursor.fetchone()
+            # Nothing deleted: work out which of the two is missing
+            row: Any = conn.execute(SQL_SELECT_NAME, (dataset_id,)).fetchone()
             if not row:
                 msg = f"Dataset with ID '{dataset_id}' not found"
                 raise KeyError(msg)
-
-            name: str = row[0]
-
-            # Check if tag exists
-            tag_cursor: sqlite3.Cursor = conn.execute(
-                "SELECT 1 FROM tags WHERE name = ? AND tag = ?", (name, tag)
-            )
-            if not tag_cursor.fetchone():
-                msg = f"Tag '{tag}' not found for dataset '{name}'"
-                raise KeyError(msg)
-
-            # Delete tag
-            conn.execute("DELETE FROM tags WHERE name = ? AND tag = ?", (name, tag))
-            conn.commit()
-        finally:
-            conn.close()
+            msg = f"Tag '{tag}' not found for dataset '{row[0]}'"
+            raise KeyError(msg)
 
     def list_tags(self, dataset_id: str) -> list[tuple[str, str]]:
         """List all tags for a dataset with timestamps.
@@ -470,20 +768,9 @@ class MetadataRepository:
         Returns:
             List of (tag, created_at) tuples, ordered by creation time (newest first)
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT tag, created_at
-                FROM tags
-                WHERE dataset_id = ?
-                ORDER BY created_at DESC
-                """,
-                (dataset_id,),
-            )
-            return [(row[0], row[1]) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        cursor: sqlite3.Cursor = conn.execute(SQL_LIST_TAGS, (dataset_id,))
+        return [(tag, created_at) for tag, created_at in cursor]
 
     # -----------------------------
     # Deletion
@@ -498,12 +785,22 @@ class MetadataRepository:
         Note:
             Cascades to tags and lineage via foreign keys (ON DELETE CASCADE)
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("DELETE FROM datasets WHERE id = ?", (dataset_id,))
-            conn.commit()
-        finally:
-            conn.close()
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
+            conn.execute(SQL_DELETE_DATASET, (dataset_id,))
+
+    def delete_metadata_many(self, dataset_ids: list[str]) -> None:
+        """Delete all metadata for several datasets in one transaction.
+
+        Args:
+            dataset_ids: Dataset IDs
+
+        Note:
+            Cascades to tags and lineage via foreign keys (ON DELETE CASCADE)
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        with conn:
+            conn.execute(SQL_DELETE_DATASETS, (_json_dumps(dataset_ids),))
 
     def get_children(self, dataset_id: str) -> list[DatasetMetadata]:
         """Get all child datasets.
@@ -514,17 +811,30 @@ class MetadataRepository:
         Returns:
             List of child dataset metadata
         """
-        conn: sqlite3.Connection = sqlite3.connect(self.db_path)
-        try:
-            cursor: sqlite3.Cursor = conn.execute(
-                """
-                SELECT child_id FROM lineage
-                WHERE parent_id = ?
-                """,
-                (dataset_id,),
-            )
-            child_ids: list[str] = [row[0] for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        return self.get_children_many([dataset_id])[dataset_id]
+
+    def get_children_many(
+        self, dataset_ids: list[str]
+    ) -> dict[str, list[DatasetMetadata]]:
+        """Get the child datasets of several parents in two queries.
 
-        return [self.load(child_id) for child_id in child_ids]
+        Args:
+            dataset_ids: Parent dataset IDs
+
+        Returns:
+            Mapping of each parent ID to its child dataset metadata
+        """
+        conn: sqlite3.Connection = _get_conn(self.db_path)
+        edges: list[tuple[str, str]] = conn.execute(
+            SQL_SELECT_CHILD_EDGES, (_json_dumps(dataset_ids),)
+        ).fetchall()
+
+        child_metas: dict[str, DatasetMetadata] = {
+            meta.id: meta
+            for meta in self.load_many(list({child for _, child in edges}))
+        }
+        children: dict[str, list[DatasetMetadata]] = {i: [] for i in dataset_ids}
+        for parent_id, child_id in edges:
+            if child_id in child_metas:
+                children[parent_id].append(child_metas[child_id])
+        return children
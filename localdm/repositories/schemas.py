@@ -1,5 +1,18 @@
 # SQL Schema Definitions
 
+# Per-connection tuning, applied once when a cached connection is opened.
+# WAL lets readers proceed while a writer commits; NORMAL sync is durable in WAL.
+# Foreign keys are off by default in SQLite and must be enabled per connection
+# for the ON DELETE CASCADE clauses below to take effect.
+SQL_CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys = ON;
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -32768;
+PRAGMA mmap_size = 268435456;
+"""
+
 SQL_CREATE_DATASETS = """
 CREATE TABLE IF NOT EXISTS datasets (
     id TEXT PRIMARY KEY,
@@ -36,10 +49,264 @@ CREATE TABLE IF NOT EXISTS tags (
 );
 """
 
+# Tag and lineage indexes cover the columns their lookups select, so those
+# never touch the table row. Hash and child-lineage lookups are served by the
+# UNIQUE/PRIMARY KEY autoindexes, so separate indexes on them are dropped.
+# Listing walks idx_datasets_created_cov backwards for ORDER BY created_at DESC
+# and tests the (unanchored) name LIKE on the index entry, without a sort; the
+# table row is read only for entries that match, since listing returns full
+# rows (schema and stats included) that no index could reasonably cover.
+# Nothing looks datasets up by exact name, so no name index.
+# Every foreign-key column leads some index (tags.dataset_id, lineage.child_id,
+# lineage.parent_id), so cascades and FK checks never scan a table.
 SQL_CREATE_INDEXES = """
-CREATE INDEX IF NOT EXISTS idx_datasets_name ON datasets(name);
-CREATE INDEX IF NOT EXISTS idx_datasets_hash ON datasets(hash);
-CREATE INDEX IF NOT EXISTS idx_tags_dataset_id ON tags(dataset_id);
-CREATE INDEX IF NOT EXISTS idx_lineage_child ON lineage(child_id);
-CREATE INDEX IF NOT EXISTS idx_lineage_parent ON lineage(parent_id);
+DROP INDEX IF EXISTS idx_datasets_hash;
+DROP INDEX IF EXISTS idx_tags_dataset_id;
+DROP INDEX IF EXISTS idx_lineage_child;
+DROP INDEX IF EXISTS idx_lineage_parent;
+DROP INDEX IF EXISTS idx_datasets_name;
+CREATE INDEX IF NOT EXISTS idx_datasets_created_cov ON datasets(created_at, name, id);
+CREATE INDEX IF NOT EXISTS idx_tags_dataset_cov ON tags(dataset_id, created_at, tag);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag, dataset_id);
+CREATE INDEX IF NOT EXISTS idx_lineage_parent_child ON lineage(parent_id, child_id);
+"""
+
+# Whole schema setup as one script in one explicit transaction: sqlite3
+# autocommits DDL, so issued one by one each statement would commit (and sync)
+# on its own.
+SQL_INIT_SCHEMA = (
+    "BEGIN;\n"
+    + SQL_CREATE_DATASETS
+    + SQL_CREATE_LINEAGE
+    + SQL_CREATE_TAGS
+    + SQL_CREATE_INDEXES
+    + "COMMIT;\n"
+)
+
+SQL_HAS_STATS = """
+SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1';
+"""
+
+# -----------------------------
+# Hot-path queries
+# -----------------------------
+# Kept as module constants so every call hands sqlite3 the identical SQL text
+# and hits the connection's prepared-statement cache.
+
+# An upsert rather than INSERT OR REPLACE: with foreign keys on, REPLACE
+# deletes the old row first and cascades away its tags and child lineage.
+SQL_INSERT_DATASET = """
+INSERT INTO datasets
+(id, hash, name, created_at, updated_at, author, data_path,
+ description, schema_json, stats_json)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    hash = excluded.hash,
+    name = excluded.name,
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    author = excluded.author,
+    data_path = excluded.data_path,
+    description = excluded.description,
+    schema_json = excluded.schema_json,
+    stats_json = excluded.stats_json
+"""
+
+SQL_INSERT_TAG = """
+INSERT OR REPLACE INTO tags (name, tag, dataset_id, created_at)
+VALUES (?, ?, ?, ?)
+"""
+
+# Tag mutations resolve the dataset's name inline, so each is one statement.
+# An existing (name, tag) pair is left untouched, even if it points at another
+# version of the dataset.
+SQL_ADD_TAG = """
+INSERT OR IGNORE INTO tags (name, tag, dataset_id, created_at)
+SELECT name, ?2, id, ?3 FROM datasets WHERE id = ?1
+"""
+
+# Points (name, tag) at this dataset, moving it off another version as a new
+# save does; a tag already on the dataset keeps its creation time.
+SQL_MOVE_TAG = """
+INSERT INTO tags (name, tag, dataset_id, created_at)
+SELECT name, ?2, id, ?3 FROM datasets WHERE id = ?1
+ON CONFLICT (name, tag) DO UPDATE SET
+    dataset_id = excluded.dataset_id,
+    created_at = excluded.created_at
+WHERE dataset_id != excluded.dataset_id
+"""
+
+SQL_REMOVE_TAG = """
+DELETE FROM tags
+WHERE name = (SELECT name FROM datasets WHERE id = ?1) AND tag = ?2
+RETURNING 1
+"""
+
+SQL_SELECT_NAME = "SELECT name FROM datasets WHERE id = ?"
+
+SQL_INSERT_LINEAGE = """
+INSERT OR IGNORE INTO lineage (child_id, parent_id)
+VALUES (?, ?)
+"""
+
+SQL_SELECT_DATASET = """
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE d.id = ?
+"""
+
+# Same columns as SQL_SELECT_DATASET, for a JSON array of IDs.
+SQL_SELECT_DATASETS = """
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE d.id IN (SELECT value FROM json_each(?))
+"""
+
+# Listing returns full rows in one statement. A NULL name pattern disables
+# the name filter and LIMIT -1 means no limit, so the SQL text stays fixed.
+SQL_LIST_DATASETS = """
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE (?1 IS NULL OR d.name LIKE ?1)
+ORDER BY d.created_at DESC
+LIMIT ?2
+"""
+
+# Tag filter first narrows to the tagged IDs through idx_tags_tag.
+SQL_LIST_DATASETS_BY_TAG = """
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE d.id IN (SELECT dataset_id FROM tags WHERE tag = ?1)
+  AND (?2 IS NULL OR d.name LIKE ?2)
+ORDER BY d.created_at DESC
+LIMIT ?3
+"""
+
+# Every transitive parent of a dataset, walked in SQL. UNION (not UNION ALL)
+# visits each ancestor once, so shared ancestors and cycles terminate.
+SQL_SELECT_ANCESTORS = """
+WITH RECURSIVE ancestors(id) AS (
+    SELECT parent_id FROM lineage WHERE child_id = ?
+    UNION
+    SELECT l.parent_id FROM lineage l JOIN ancestors a ON l.child_id = a.id
+)
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE d.id IN (SELECT id FROM ancestors)
+"""
+
+# Ancestors at most ?2 parent links away. Rows are (id, depth), so a shared
+# ancestor may be expanded once per depth, but the depth bound terminates it.
+SQL_SELECT_ANCESTORS_TO_DEPTH = """
+WITH RECURSIVE ancestors(id, depth) AS (
+    SELECT parent_id, 1 FROM lineage WHERE child_id = ?1 AND ?2 > 0
+    UNION
+    SELECT l.parent_id, a.depth + 1
+    FROM lineage l JOIN ancestors a ON l.child_id = a.id
+    WHERE a.depth < ?2
+)
+SELECT d.id, d.hash, d.name, d.created_at, d.updated_at, d.author,
+       d.data_path, d.description, d.schema_json, d.stats_json,
+       (SELECT json_group_array(tag) FROM (
+            SELECT tag FROM tags
+            WHERE dataset_id = d.id
+            ORDER BY created_at
+       )),
+       (SELECT json_group_array(parent_id) FROM lineage
+        WHERE child_id = d.id)
+FROM datasets d
+WHERE d.id IN (SELECT id FROM ancestors)
+"""
+
+SQL_SELECT_ID_BY_ID = "SELECT id FROM datasets WHERE id = ?"
+
+SQL_SELECT_ID_BY_HASH = "SELECT id FROM datasets WHERE hash = ?"
+
+SQL_SELECT_ID_BY_TAG = "SELECT dataset_id FROM tags WHERE name = ? AND tag = ?"
+
+# Bulk lookups take a JSON array so the SQL text is fixed for any batch size.
+SQL_SELECT_IDS_BY_IDS = """
+SELECT id FROM datasets WHERE id IN (SELECT value FROM json_each(?))
+"""
+
+SQL_SELECT_IDS_BY_HASHES = """
+SELECT hash, id FROM datasets WHERE hash IN (SELECT value FROM json_each(?))
+"""
+
+SQL_SELECT_IDS_BY_TAGS = """
+SELECT t.name, t.tag, t.dataset_id
+FROM json_each(?) AS r
+JOIN tags t
+  ON t.name = json_extract(r.value, '$[0]')
+ AND t.tag = json_extract(r.value, '$[1]')
+"""
+
+SQL_LIST_ALL_REFS = "SELECT name || ':' || tag FROM tags ORDER BY name, tag"
+
+SQL_LIST_TAGS = """
+SELECT tag, created_at
+FROM tags
+WHERE dataset_id = ?
+ORDER BY created_at DESC
+"""
+
+SQL_SELECT_CHILD_EDGES = """
+SELECT parent_id, child_id FROM lineage
+WHERE parent_id IN (SELECT value FROM json_each(?))
+"""
+
+# NULL leaves a field as it is, so one fixed statement serves any subset.
+SQL_UPDATE_FIELDS = """
+UPDATE datasets SET
+    name = coalesce(?2, name),
+    description = coalesce(?3, description),
+    author = coalesce(?4, author),
+    updated_at = ?5
+WHERE id = ?1
+"""
+
+SQL_DELETE_DATASET = "DELETE FROM datasets WHERE id = ?"
+
+SQL_DELETE_DATASETS = """
+DELETE FROM datasets WHERE id IN (SELECT value FROM json_each(?))
 """
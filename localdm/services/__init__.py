@@ -1,10 +1,12 @@
 # Service layer exports
 from localdm.services.dataset_service import DatasetService as DatasetService
 from localdm.services.display_service import DisplayService as DisplayService
+from localdm.services.lineage_service import LineageIndex as LineageIndex
 from localdm.services.lineage_service import LineageService as LineageService
 
 __all__ = [
     "DatasetService",
     "DisplayService",
+    "LineageIndex",
     "LineageService",
 ]
@@ -1,5 +1,6 @@
 # Standard library
 from datetime import UTC, datetime
+from functools import cache
 from typing import TYPE_CHECKING
 
 # Third-party
@@ -8,7 +9,7 @@ import polars as pl
 # Local imports
 from localdm.core.models import DatasetMetadata, DatasetStats
 from localdm.core.storage import get_object_path
-from localdm.core.utils import compute_hash, compute_stats, extract_schema
+from localdm.core.utils import extract_schema_and_stats
 from localdm.core.validation import (
     validate_dataframe,
     validate_dataset_name,
@@ -21,6 +22,34 @@ from localdm.repositories.metadata_repository import MetadataRepository
 if TYPE_CHECKING:
     from pathlib import Path
 
+# -----------------------------
+# Helpers
+# -----------------------------
+
+
+@cache
+def _default_author() -> str:
+    """Look up the current system username once per process."""
+    import getpass
+
+    try:
+        return getpass.getuser()
+    except Exception:  # noqa: BLE001
+        return "unknown"
+
+
+def _identical_data_message(
+    name: str, existing: DatasetMetadata, parent_ids: list[str]
+) -> str:
+    """Build the ValueError message for data already stored as ``existing``."""
+    if existing.id in parent_ids:
+        return (
+            f"Data for '{name}' is identical to its parent '{existing.ref}'; "
+            "nothing was derived"
+        )
+    return f"Data for '{name}' is already stored as dataset '{existing.ref}'"
+
+
 # -----------------------------
 # Dataset Service
 # -----------------------------
@@ -61,34 +90,119 @@ class DatasetService:
         Returns:
             DatasetMetadata for created dataset
         """
-        # Validate inputs
-        validate_dataset_name(name)
-        validate_dataframe(data)
-        validate_description(description)
-        if tag:
-            validate_tag_name(tag)
+        return self.create_datasets(
+            {name: data},
+            tag=tag,
+            parent_refs=parent_refs,
+            description=description,
+            author=author,
+        )[0]
+
+    def create_datasets(
+        self,
+        datasets: dict[str, pl.DataFrame],
+        tag: str | None = None,
+        parent_refs: list[str] | None = None,
+        description: str | None = None,
+        author: str | None = None,
+    ) -> list[DatasetMetadata]:
+        """Create several datasets sharing tag, parents, description and author.
+
+        Arguments are validated before anything is written. Parquet files are
+        written first, then all metadata is committed in one transaction; if
+        any input is rejected or the commit fails, the objects this call wrote
+        are deleted again, so a failed batch leaves storage unchanged.
+
+        Re-saving data that is already stored under the same name and parents
+        (an idempotent pipeline re-run) returns the existing dataset instead
+        of replacing it, so its ID, children and lineage are untouched; the
+        tag, if given, is moved to it from any other version. Content hashes
+        are unique, so data already stored as any other dataset is rejected.
+
+        Args:
+            datasets: Mapping of dataset name to DataFrame
+            tag: Optional tag name applied to each dataset
+            parent_refs: Optional list of parent references for each dataset
+            description: Optional description (can be detailed, multiline text)
+            author: Optional author (defaults to current username)
+
+        Returns:
+            DatasetMetadata for each created dataset, in input order
+
+        Raises:
+            ValueError: If two inputs have identical data, or an input's data
+                is already stored as another dataset (such as a parent)
+        """
+        self._validate_inputs(datasets, tag, description)
 
         # Auto-detect author if not provided
         if author is None:
             author = self._get_default_author()
 
-        # Build metadata with business rules
-        metadata: DatasetMetadata = self._create_metadata(
-            data=data,
-            name=name,
-            tag=tag,
-            parent_refs=parent_refs or [],
-            author=author,
-            description=description,
+        # Lineage is stored by ID; resolve all parent refs in one pass
+        parent_ids: list[str] = (
+            self.metadata_repo.resolve_refs_to_ids(parent_refs) if parent_refs else []
         )
 
-        # Persist data via DataRepository
-        self.data_repo.save_data(data, metadata)
-
-        # Persist metadata via MetadataRepository
-        self.metadata_repo.save(metadata)
+        # One timestamp for the batch: its metadata is committed together
+        timestamp: str = datetime.now(UTC).isoformat()
 
-        return metadata
+        metadatas: list[DatasetMetadata] = []
+        new_metadatas: list[DatasetMetadata] = []
+        reused_ids: list[str] = []
+        # Content hash -> metadata for this batch; hashes are unique per dataset
+        by_hash: dict[str, DatasetMetadata] = {}
+        # Objects this call created; removed again if the batch fails
+        written: list[str] = []
+        try:
+            for name, data in datasets.items():
+                # Persist data via DataRepository; the content hash comes from
+                # the write
+                hash_val, created = self.data_repo.store_data(data)
+                if created:
+                    written.append(hash_val)
+                existing: DatasetMetadata | None = self._find_reusable(
+                    name, hash_val, parent_ids, by_hash
+                )
+                if existing is not None:
+                    metadatas.append(existing)
+                    reused_ids.append(existing.id)
+                    by_hash[hash_val] = existing
+                    continue
+
+                # Build metadata with business rules
+                metadata: DatasetMetadata = self._create_metadata(
+                    data=data,
+                    hash_val=hash_val,
+                    name=name,
+                    tag=tag,
+                    parent_refs=parent_ids,
+                    author=author,
+                    description=description,
+                    timestamp=timestamp,
+                )
+                metadatas.append(metadata)
+                new_metadatas.append(metadata)
+                by_hash[hash_val] = metadata
+
+            # Persist metadata via MetadataRepository
+            if new_metadatas:
+                self.metadata_repo.save_many(new_metadatas)
+        except Exception:
+            # No metadata refers to them: nothing was committed
+            self.data_repo.delete_data_many(written)
+            raise
+        if not reused_ids:
+            return metadatas
+
+        # The tag moves to a reused dataset just as it would to a new one
+        if tag:
+            for dataset_id in reused_ids:
+                self.metadata_repo.move_tag(dataset_id, tag)
+        reloaded: dict[str, DatasetMetadata] = {
+            meta.id: meta for meta in self.metadata_repo.load_many(reused_ids)
+        }
+        return [reloaded.get(meta.id, meta) for meta in metadatas]
 
     def derive_dataset(
         self,
@@ -142,6 +256,9 @@ class DatasetService:
         Returns:
             Updated DatasetMetadata
 
+        Raises:
+            ValueError: If the new data is already stored as another dataset
+
         Example:
             # Load, modify, update
             meta = metadata_repo.load(dataset_id)
@@ -156,33 +273,27 @@ class DatasetService:
         # Load existing metadata
         old_metadata: DatasetMetadata = self.metadata_repo.load(dataset_id)
 
-        # Compute new hash and metadata
-        new_hash: str = compute_hash(data)
-        new_schema: dict[str, str] = extract_schema(data)
-        new_stats: DatasetStats = compute_stats(data)
-        new_data_path: Path = get_object_path(self.data_repo.repo_path, new_hash)
-
-        # Delete old parquet file if hash changed
+        # Save new parquet file, then drop the old one if the content changed
+        new_hash: str = self.data_repo.save_data(data)
         if new_hash != old_metadata.hash:
+            other: DatasetMetadata | None = self.metadata_repo.find_by_hash(new_hash)
+            if other is not None:
+                msg = f"Identical data is already stored as dataset '{other.ref}'"
+                raise ValueError(msg)
             self.data_repo.delete_data(old_metadata.hash)
 
-        # Save new parquet file
-        # Create a temporary metadata object just for saving data
-        temp_metadata = DatasetMetadata(
-            id=dataset_id,
-            hash=new_hash,
-            name=old_metadata.name,
-            tags=[],
-            created_at=old_metadata.created_at,
-            updated_at=datetime.now(UTC).isoformat(),
-            author=old_metadata.author,
-            parent_refs=[],
-            description=None,
-            schema=None,
-            stats=None,
-            data_path=str(new_data_path),
-        )
-        self.data_repo.save_data(data, temp_metadata)
+        # Compute new metadata; identical content keeps its schema and stats
+        new_schema: dict[str, str]
+        new_stats: DatasetStats
+        if (
+            new_hash == old_metadata.hash
+            and old_metadata.schema is not None
+            and old_metadata.stats is not None
+        ):
+            new_schema, new_stats = old_metadata.schema, old_metadata.stats
+        else:
+            new_schema, new_stats = extract_schema_and_stats(data)
+        new_data_path: Path = get_object_path(self.data_repo.repo_path, new_hash)
 
         # Create updated metadata (keeps ID, tags, lineage)
         updated_metadata = DatasetMetadata(
@@ -211,54 +322,101 @@ class DatasetService:
     # Business Logic Helpers
     # -----------------------------
 
+    @staticmethod
+    def _validate_inputs(
+        datasets: dict[str, pl.DataFrame], tag: str | None, description: str | None
+    ) -> None:
+        """Validate every name and frame of a batch, its tag and description."""
+        for name, data in datasets.items():
+            validate_dataset_name(name)
+            validate_dataframe(data)
+        validate_description(description)
+        if tag:
+            validate_tag_name(tag)
+
+    def _find_reusable(
+        self,
+        name: str,
+        hash_val: str,
+        parent_ids: list[str],
+        by_hash: dict[str, DatasetMetadata],
+    ) -> DatasetMetadata | None:
+        """Check a saved input's hash against its batch and stored datasets.
+
+        Same bytes, name and parents already stored: that dataset is reused.
+        Same bytes as any other dataset is refused rather than superseded,
+        which would cascade away its tags, lineage and children's links.
+
+        Args:
+            name: Dataset name of the input
+            hash_val: Content hash of the input
+            parent_ids: Parent IDs requested for the input
+            by_hash: Metadata of the earlier inputs of the batch, by hash
+
+        Returns:
+            Stored dataset to reuse, or None if the data is not stored yet
+
+        Raises:
+            ValueError: If an earlier input or another stored dataset has the
+                same data
+        """
+        duplicate: DatasetMetadata | None = by_hash.get(hash_val)
+        if duplicate is not None:
+            msg = f"Datasets '{duplicate.name}' and '{name}' have identical data"
+            raise ValueError(msg)
+
+        existing: DatasetMetadata | None = self.metadata_repo.find_by_hash(hash_val)
+        if existing is None:
+            return None
+        if existing.name != name or sorted(existing.parent_refs) != sorted(parent_ids):
+            raise ValueError(_identical_data_message(name, existing, parent_ids))
+        return existing
+
     def _get_default_author(self) -> str:
         """Get default author (current system username).
 
         Returns:
             Current username or 'unknown'
         """
-        import getpass
-
-        try:
-            return getpass.getuser()
-        except Exception:  # noqa: BLE001
-            return "unknown"
+        return _default_author()
 
     def _create_metadata(
         self,
         data: pl.DataFrame,
+        hash_val: str,
         name: str,
         tag: str | None,
         parent_refs: list[str],
         author: str,
         description: str | None,
+        timestamp: str,
     ) -> DatasetMetadata:
         """Create DatasetMetadata with business rules.
 
         Business rules:
-        - Generate hash from data
         - Extract schema and stats from data
-        - Use current UTC timestamp
+        - Use the caller's UTC timestamp for creation and update time
         - Compute data path from hash
 
         Args:
             data: DataFrame to analyze
+            hash_val: Content hash returned by ``DataRepository.save_data``
             name: Dataset name
             tag: Optional tag
             parent_refs: List of parent references
             author: Dataset author
             description: Optional description
+            timestamp: ISO-8601 UTC creation time
 
         Returns:
             DatasetMetadata with all fields populated
         """
         # Generate ID and compute metadata
         dataset_id: str = self.metadata_repo.generate_id()
-        hash_val: str = compute_hash(data)
-        schema: dict[str, str] = extract_schema(data)
-        stats: DatasetStats = compute_stats(data)
+        schema: dict[str, str]
+        stats: DatasetStats
+        schema, stats = extract_schema_and_stats(data)
         data_path: Path = get_object_path(self.data_repo.repo_path, hash_val)
-        timestamp: str = datetime.now(UTC).isoformat()
 
         return DatasetMetadata(
             id=dataset_id,
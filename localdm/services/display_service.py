@@ -1,15 +1,19 @@
 # Standard library
-
-# Third-party
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
+from functools import cached_property
+from typing import TYPE_CHECKING
 
 # Local imports
 from localdm.core.models import ColumnStats, DatasetMetadata
 from localdm.repositories.metadata_repository import MetadataRepository
-from localdm.services.lineage_service import LineageService
+from localdm.services.lineage_service import LineageIndex, LineageService
+
+# Rich is imported inside the methods that render, so importing localdm for
+# non-interactive use (pipelines, batch jobs) never loads it.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.tree import Tree
 
 # -----------------------------
 # Constants
@@ -17,6 +21,9 @@ from localdm.services.lineage_service import LineageService
 
 NULL_PCT_HIGH_THRESHOLD = 50
 NULL_PCT_MEDIUM_THRESHOLD = 10
+TABLE_CHUNK_ROWS = 1000
+HASH_WIDTH = 7  # DatasetMetadata.short_hash
+DATE_WIDTH = 10  # YYYY-MM-DD
 
 # -----------------------------
 # Display Service
@@ -33,7 +40,13 @@ class DisplayService:
     ) -> None:
         self.metadata_repo: MetadataRepository = metadata_repo
         self.lineage_service: LineageService = lineage_service
-        self.console = Console()
+
+    @cached_property
+    def console(self) -> "Console":
+        """Console shared by all display operations, created on first use."""
+        from rich.console import Console
+
+        return Console()
 
     # -----------------------------
     # Display Operations
@@ -41,37 +54,28 @@ class DisplayService:
 
     def show_tree(self) -> None:
         """Render a full dataset lineage tree."""
-        root: Tree = Tree("[bold cyan]Datasets[/]")
+        from rich.tree import Tree
 
-        # Load all metadata
-        all_meta: dict[str, DatasetMetadata] = {
-            meta.ref: meta for meta in self.metadata_repo.list_datasets()
-        }
-
-        # parent → children
-        children: dict[str, list[str]] = {}
-        for meta in all_meta.values():
-            for parent in meta.parent_refs or []:
-                children.setdefault(parent, []).append(meta.ref)
+        root: Tree = Tree("[bold cyan]Datasets[/]")
 
-        # roots = datasets without parents
-        root_refs: list[str] = [
-            ref for ref, meta in all_meta.items() if not meta.parent_refs
-        ]
+        # Shared index of all metadata, rebuilt only after writes
+        index: LineageIndex = self.lineage_service.get_index()
 
         def fmt(meta: DatasetMetadata) -> str:
-            tags: str = f"[{', '.join(meta.tags)}]" if meta.tags else ""
-            date: str = meta.created_at.split("T")[0]
+            tags: str = f"\\[{meta.tags_display}]" if meta.tags else ""
+            date: str = meta.created_date
             return f"[green]{meta.name}[/]  {tags}   id={meta.id}   {date}"
 
-        def add_subtree(node: Tree, ref: str) -> None:
-            meta: DatasetMetadata = all_meta[ref]
-            sub: Tree = node.add(fmt(meta))
-            for child_ref in sorted(children.get(ref, [])):
-                add_subtree(sub, child_ref)
-
-        for ref in sorted(root_refs):
-            add_subtree(root, ref)
+        # Depth-first with an explicit stack, so deep lineages cannot hit the
+        # recursion limit; pushing in reverse keeps siblings in sorted order
+        stack: list[tuple[Tree, str]] = [(root, i) for i in reversed(index.roots)]
+        while stack:
+            node, dataset_id = stack.pop()
+            sub: Tree = node.add(fmt(index.by_id[dataset_id]))
+            stack.extend(
+                (sub, child_id)
+                for child_id in reversed(index.children.get(dataset_id, []))
+            )
 
         self.console.print(root)
 
@@ -97,20 +101,78 @@ class DisplayService:
         """Display all datasets in a rich table.
 
         Args:
-            name_filter: Optional name pattern to filter by
+            name_filter: Optional name substring, or LIKE pattern with ``%``
         """
         datasets: list[DatasetMetadata] = self.metadata_repo.list_datasets(
             name_filter=name_filter
         )
 
-        table: Table = Table(
-            title="Datasets", show_header=True, header_style="bold magenta"
+        # Small listings print as one table. Large ones are split into tables
+        # of TABLE_CHUNK_ROWS rows, each measured and laid out on its own, and
+        # shown through the pager instead of scrolling past.
+        if len(datasets) <= TABLE_CHUNK_ROWS:
+            self.console.print(self._datasets_table(datasets, title="Datasets"))
+            return
+
+        with self.console.pager(styles=True):
+            for start in range(0, len(datasets), TABLE_CHUNK_ROWS):
+                chunk: list[DatasetMetadata] = datasets[
+                    start : start + TABLE_CHUNK_ROWS
+                ]
+                self.console.print(
+                    self._datasets_table(
+                        chunk, title="Datasets" if start == 0 else None
+                    )
+                )
+
+    def visualize_lineage_tree(self, ref: str, max_depth: int = 5) -> None:
+        """Display lineage tree for a dataset.
+
+        Args:
+            ref: Dataset reference
+            max_depth: Maximum depth to traverse
+        """
+        from rich.tree import Tree
+
+        dataset_id: str = self.metadata_repo.resolve_ref_to_id(ref)
+        meta: DatasetMetadata = self.metadata_repo.load(dataset_id)
+
+        tree: Tree = Tree(f"[bold cyan]{meta.ref}[/] ({meta.created_date})")
+
+        # Build parent tree from the ancestors it can show, fetched in one query
+        ancestors: dict[str, DatasetMetadata] = self.metadata_repo.get_ancestors(
+            meta.id, max_depth
         )
+        self._build_parent_tree(tree, meta, ancestors, max_depth)
+
+        self.console.print(tree)
+
+    # -----------------------------
+    # Formatting Helpers
+    # -----------------------------
+
+    def _datasets_table(
+        self, datasets: list[DatasetMetadata], title: str | None
+    ) -> "Table":
+        """Format datasets as a Rich table, one row per dataset.
+
+        Args:
+            datasets: Dataset metadata to list
+            title: Optional table title
+
+        Returns:
+            Rich Table with one row per dataset
+        """
+        from rich.table import Table
+
+        table: Table = Table(title=title, show_header=True, header_style="bold magenta")
         table.add_column("Name", style="cyan")
         table.add_column("Tags", style="green")
-        table.add_column("Hash", style="yellow")
-        table.add_column("Created", style="blue")
-        table.add_column("Updated", style="blue")
+        # Fixed-length columns get a fixed width, so Rich does not measure
+        # every cell in them; free-text columns keep their measured width
+        table.add_column("Hash", style="yellow", width=HASH_WIDTH, no_wrap=True)
+        table.add_column("Created", style="blue", width=DATE_WIDTH, no_wrap=True)
+        table.add_column("Updated", style="blue", width=DATE_WIDTH, no_wrap=True)
         table.add_column("Author", style="magenta")
         table.add_column("Rows", justify="right", style="white")
         table.add_column("Cols", justify="right", style="white")
@@ -127,41 +189,20 @@ class DisplayService:
 
             table.add_row(
                 meta.name,
-                ", ".join(meta.tags) if meta.tags else "-",
-                meta.hash[:7],
-                meta.created_at.split("T")[0],
-                meta.updated_at.split("T")[0],
+                meta.tags_display or "-",
+                meta.short_hash,
+                meta.created_date,
+                meta.updated_date,
                 meta.author,
                 rows_str,
                 cols_str,
             )
 
-        self.console.print(table)
-
-    def visualize_lineage_tree(self, ref: str, max_depth: int = 5) -> None:
-        """Display lineage tree for a dataset.
-
-        Args:
-            ref: Dataset reference
-            max_depth: Maximum depth to traverse
-        """
-        dataset_id: str = self.metadata_repo.resolve_ref_to_id(ref)
-        meta: DatasetMetadata = self.metadata_repo.load(dataset_id)
-
-        tree: Tree = Tree(f"[bold cyan]{meta.ref}[/] ({meta.created_at.split('T')[0]})")
-
-        # Build parent tree recursively
-        self._build_parent_tree(tree, meta, 0, max_depth)
-
-        self.console.print(tree)
-
-    # -----------------------------
-    # Formatting Helpers
-    # -----------------------------
+        return table
 
     def _format_metadata_panel(
         self, metadata: DatasetMetadata, lineage_lines: list[str]
-    ) -> Panel:
+    ) -> "Panel":
         """Format metadata as Rich panel.
 
         Args:
@@ -171,6 +212,8 @@ class DisplayService:
         Returns:
             Rich Panel with formatted metadata
         """
+        from rich.panel import Panel
+
         sections: list[str] = []
 
         # Basic info
@@ -182,7 +225,7 @@ class DisplayService:
         sections.append(f"[bold cyan]Author:[/] {metadata.author}")
 
         if metadata.tags:
-            sections.append(f"[bold cyan]Tags:[/] {', '.join(metadata.tags)}")
+            sections.append(f"[bold cyan]Tags:[/] {metadata.tags_display}")
 
         # Statistics
         if metadata.stats:
@@ -197,26 +240,13 @@ class DisplayService:
             if column_stats:
                 sections.append("")
                 sections.append("[bold yellow]Column Details:[/]")
-                for col_name, col_stat in column_stats.items():
-                    null_pct: float = col_stat["null_percentage"]
-                    unique: int = col_stat["unique_count"]
-                    dtype: str = (
-                        metadata.schema.get(col_name, "?") if metadata.schema else "?"
-                    )
-
-                    # Color code by null percentage
-                    if null_pct > NULL_PCT_HIGH_THRESHOLD:
-                        color = "red"
-                    elif null_pct > NULL_PCT_MEDIUM_THRESHOLD:
-                        color = "yellow"
-                    else:
-                        color = "green"
-
-                    unique_str = f"{unique:,}"
-                    sections.append(
-                        f"  {col_name} ({dtype}): {unique_str} unique, "
-                        f"[{color}]{null_pct:.5f}% null[/]"
+                schema: dict[str, str] = metadata.schema or {}
+                sections.append(
+                    "\n".join(
+                        self._format_column_line(name, stat, schema.get(name, "?"))
+                        for name, stat in column_stats.items()
                     )
+                )
 
         # Schema (more compact if we already showed column details)
         if metadata.schema and not (metadata.stats and metadata.stats["column_stats"]):
@@ -243,27 +273,69 @@ class DisplayService:
             border_style="bright_blue",
         )
 
+    @staticmethod
+    def _format_column_line(col_name: str, col_stat: ColumnStats, dtype: str) -> str:
+        """Format one column's line of the column details section.
+
+        Args:
+            col_name: Column name
+            col_stat: Statistics for the column
+            dtype: Column dtype string
+
+        Returns:
+            Markup line, null percentage colour-coded
+        """
+        null_pct: float = col_stat["null_percentage"]
+
+        # Color code by null percentage
+        if null_pct > NULL_PCT_HIGH_THRESHOLD:
+            color = "red"
+        elif null_pct > NULL_PCT_MEDIUM_THRESHOLD:
+            color = "yellow"
+        else:
+            color = "green"
+
+        return (
+            f"  {col_name} ({dtype}): {col_stat['unique_count']:,} unique, "
+            f"[{color}]{null_pct:.5f}% null[/]"
+        )
+
     def _build_parent_tree(
         self,
-        node: Tree,
+        node: "Tree",
         dataset_meta: DatasetMetadata,
-        depth: int,
+        ancestors: dict[str, DatasetMetadata],
         max_depth: int,
     ) -> None:
-        """Recursively build parent lineage tree.
+        """Build parent lineage tree breadth-first, one level at a time.
+
+        An ancestor reached along more than one path (a diamond in the DAG) is
+        expanded once; later occurrences render as a dim ``(seen)`` leaf, so
+        the tree grows with the number of ancestors rather than paths.
 
         Args:
             node: Rich Tree node to add parents to
             dataset_meta: Metadata of current dataset
-            depth: Current recursion depth
+            ancestors: Preloaded ancestor metadata by ID
             max_depth: Maximum depth to traverse
         """
-        if depth >= max_depth or not dataset_meta.parent_refs:
-            return
-
-        for parent_id in dataset_meta.parent_refs:
-            parent_meta: DatasetMetadata = self.metadata_repo.load(parent_id)
-            parent_node: Tree = node.add(
-                f"[green]{parent_meta.ref}[/] ({parent_meta.created_at.split('T')[0]})"
-            )
-            self._build_parent_tree(parent_node, parent_meta, depth + 1, max_depth)
+        level: list[tuple[Tree, DatasetMetadata]] = [(node, dataset_meta)]
+        seen: set[str] = {dataset_meta.id}
+        for _ in range(max_depth):
+            next_level: list[tuple[Tree, DatasetMetadata]] = []
+            for level_node, level_meta in level:
+                for parent_id in level_meta.parent_refs:
+                    parent_meta: DatasetMetadata | None = ancestors.get(parent_id)
+                    if parent_meta is None:
+                        continue
+                    if parent_id in seen:
+                        level_node.add(f"[dim]{parent_meta.ref} (seen)[/]")
+                        continue
+                    seen.add(parent_id)
+                    parent_node: Tree = level_node.add(
+                        f"[green]{parent_meta.ref}[/] ({parent_meta.created_date})"
+                    )
+                    next_level.append((parent_node, parent_meta))
+            if not next_level:
+                return
+            level = next_level
@@ -1,11 +1,52 @@
-# Local imports
+# Standard library
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+# Local imports
 from localdm.repositories.metadata_repository import MetadataRepository
 
 if TYPE_CHECKING:
     from localdm.core.models import DatasetMetadata
 
+# -----------------------------
+# Lineage Index
+# -----------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class LineageIndex:
+    """Whole-catalog lineage, built from one listing.
+
+    Child and root ID lists are sorted by ref. Parent IDs with no dataset row
+    have no entry in ``by_id``, and a dataset none of whose parents resolve
+    (such as lineage stored by older versions as ``name:tag``) is a root.
+    """
+
+    by_id: dict[str, "DatasetMetadata"]
+    children: dict[str, list[str]]
+    roots: list[str]
+
+    @classmethod
+    def build(cls, metas: list["DatasetMetadata"]) -> "LineageIndex":
+        """Index datasets by ID and invert their parent links."""
+        by_id: dict[str, DatasetMetadata] = {meta.id: meta for meta in metas}
+        children: dict[str, list[str]] = {}
+        for meta in metas:
+            for parent_id in meta.parent_refs:
+                children.setdefault(parent_id, []).append(meta.id)
+        for child_ids in children.values():
+            child_ids.sort(key=lambda i: by_id[i].ref)
+        roots: list[str] = sorted(
+            (
+                meta.id
+                for meta in metas
+                if not any(parent_id in by_id for parent_id in meta.parent_refs)
+            ),
+            key=lambda i: by_id[i].ref,
+        )
+        return cls(by_id=by_id, children=children, roots=roots)
+
+
 # -----------------------------
 # Lineage Service
 # -----------------------------
@@ -16,6 +57,25 @@ class LineageService:
 
     def __init__(self, metadata_repo: MetadataRepository) -> None:
         self.metadata_repo: MetadataRepository = metadata_repo
+        self._index: LineageIndex | None = None
+        self._index_version: tuple[int, int] | None = None
+
+    # -----------------------------
+    # Lineage Index
+    # -----------------------------
+
+    def get_index(self) -> LineageIndex:
+        """Get the whole-catalog lineage index.
+
+        The index is rebuilt only after the metadata database has been
+        written (see ``MetadataRepository.version``); otherwise repeated
+        calls return the same object, which must be treated as read-only.
+        """
+        version: tuple[int, int] = self.metadata_repo.version()
+        if self._index is None or version != self._index_version:
+            self._index = LineageIndex.build(self.metadata_repo.list_datasets())
+            self._index_version = version
+        return self._index
 
     # -----------------------------
     # Lineage Traversal
@@ -30,31 +90,41 @@ class LineageService:
         Returns:
             Set of root dataset references (datasets with no parents)
         """
-        roots: set[str] = set()
-        visited: set[str] = set()
-
-        def traverse_to_roots(current_id: str) -> None:
-            if current_id in visited:
-                return
-            visited.add(current_id)
-
-            try:
-                metadata: DatasetMetadata = self.metadata_repo.load(current_id)
-                if not metadata.parent_refs:
-                    roots.add(metadata.ref)
-                else:
-                    for parent_id in metadata.parent_refs:
-                        traverse_to_roots(parent_id)
-            except (KeyError, FileNotFoundError):
-                roots.add(current_id)
-
-        # Start traversal from given dataset's parents
         dataset_id: str = self.metadata_repo.resolve_ref_to_id(ref)
         metadata: DatasetMetadata = self.metadata_repo.load(dataset_id)
-        for parent_id in metadata.parent_refs:
-            traverse_to_roots(parent_id)
+        ancestors: dict[str, DatasetMetadata] = self.metadata_repo.get_ancestors(
+            dataset_id
+        )
+
+        root_metas: list[DatasetMetadata]
+        missing_ids: set[str]
+        root_metas, missing_ids = self._split_roots(metadata, ancestors)
+        return {meta.ref for meta in root_metas} | missing_ids
+
+    @staticmethod
+    def _split_roots(
+        metadata: "DatasetMetadata", ancestors: dict[str, "DatasetMetadata"]
+    ) -> tuple[list["DatasetMetadata"], set[str]]:
+        """Find the roots of an already loaded ancestry.
 
-        return roots
+        Args:
+            metadata: Dataset whose ancestry this is
+            ancestors: Its ancestors by ID, as from ``get_ancestors``
+
+        Returns:
+            Ancestors with no parents, and parent IDs with no dataset row
+            (reported as roots by ID)
+        """
+        root_metas: list[DatasetMetadata] = [
+            meta for meta in ancestors.values() if not meta.parent_refs
+        ]
+        missing_ids: set[str] = {
+            parent_id
+            for meta in (metadata, *ancestors.values())
+            for parent_id in meta.parent_refs
+            if parent_id not in ancestors
+        }
+        return root_metas, missing_ids
 
     def get_parent_by_name(self, ref: str, parent_name: str) -> str:
         """Get specific parent reference by name.
@@ -72,13 +142,9 @@ class LineageService:
         dataset_id: str = self.metadata_repo.resolve_ref_to_id(ref)
         metadata: DatasetMetadata = self.metadata_repo.load(dataset_id)
 
-        for parent_id in metadata.parent_refs:
-            try:
-                parent_meta: DatasetMetadata = self.metadata_repo.load(parent_id)
-                if parent_meta.name == parent_name:
-                    return parent_meta.ref
-            except (KeyError, FileNotFoundError):
-                continue
+        for parent_meta in self.metadata_repo.load_many(metadata.parent_refs):
+            if parent_meta.name == parent_name:
+                return parent_meta.ref
 
         msg = f"No parent with name '{parent_name}' found for dataset '{ref}'"
         raise ValueError(msg)
@@ -104,27 +170,34 @@ class LineageService:
         lines: list[str] = []
         dataset_id: str = self.metadata_repo.resolve_ref_to_id(ref)
         metadata: DatasetMetadata = self.metadata_repo.load(dataset_id)
-        roots: set[str] = self.find_root_datasets(ref)
+
+        # The whole ancestry comes from one query; roots and parents are
+        # picked from it without further lookups
+        ancestors: dict[str, DatasetMetadata] = self.metadata_repo.get_ancestors(
+            dataset_id
+        )
+        root_metas: list[DatasetMetadata]
+        missing_ids: set[str]
+        root_metas, missing_ids = self._split_roots(metadata, ancestors)
+        roots: set[str] = {meta.ref for meta in root_metas} | missing_ids
 
         # Display roots
-        for root_ref in sorted(roots):
-            try:
-                root_id: str = self.metadata_repo.resolve_ref_to_id(root_ref)
-                root_meta: DatasetMetadata = self.metadata_repo.load(root_id)
-                lines.append(f"  [white]{root_meta.ref}[/] (root)")
-            except (KeyError, FileNotFoundError):
-                lines.append(f"  [white]{root_ref}[/] (root, not found)")
+        root_lines: list[tuple[str, str]] = [
+            (meta.ref, f"  [white]{meta.ref}[/] (root)") for meta in root_metas
+        ]
+        root_lines.extend(
+            (root_id, f"  [white]{root_id}[/] (root, not found)")
+            for root_id in missing_ids
+        )
+        lines.extend(line for _, line in sorted(root_lines))
 
         # Display immediate parents (if different from roots)
         # parent_refs are now IDs, need to convert to refs for display
-        immediate_parent_metas: list[DatasetMetadata] = []
-        for parent_id in metadata.parent_refs:
-            try:
-                parent_meta: DatasetMetadata = self.metadata_repo.load(parent_id)
-                if parent_meta.ref not in roots:
-                    immediate_parent_metas.append(parent_meta)
-            except (KeyError, FileNotFoundError):
-                continue
+        immediate_parent_metas: list[DatasetMetadata] = [
+            ancestors[parent_id]
+            for parent_id in metadata.parent_refs
+            if parent_id in ancestors and ancestors[parent_id].ref not in roots
+        ]
 
         if immediate_parent_metas:
             if roots:
@@ -0,0 +1,17 @@
+# Standard library
+from collections.abc import Iterator
+from pathlib import Path
+
+# Third-party
+import pytest
+
+# Local imports
+from localdm import DataManager
+from localdm.repositories.metadata_repository import close_all
+
+
+@pytest.fixture
+def dm(tmp_path: Path) -> Iterator[DataManager]:
+    """DataManager over a fresh repository; its connections close afterwards."""
+    yield DataManager(tmp_path / "repo")
+    close_all()
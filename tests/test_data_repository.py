@@ -0,0 +1,25 @@
+# Third-party
+import polars as pl
+import pytest
+
+# Local imports
+from localdm import DataManager
+from localdm.repositories import data_repository
+
+
+def test_only_full_reads_prefetch_the_file(
+    dm: DataManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prefetched: list[object] = []
+    monkeypatch.setattr(data_repository, "_prefetch", prefetched.append)
+    dm.create_dataset("wide", pl.DataFrame({"a": [1, 2], "b": [3, 4]}), tag="v1")
+    dataset_id: str = dm.list_datasets()[0].id
+
+    dm.get(dataset_id, columns=["a"]).collect()
+    dm.get(dataset_id, predicate=pl.col("a") > 1).collect()
+    dm.collect_many([dataset_id], columns=["b"])
+    assert prefetched == []
+
+    dm.get(dataset_id).collect()
+    dm.collect_many([dataset_id])
+    assert len(prefetched) == 2
@@ -0,0 +1,114 @@
+# Standard library
+from pathlib import Path
+
+# Third-party
+import polars as pl
+import pytest
+
+# Local imports
+from localdm import DataManager
+from localdm.core import DatasetMetadata
+
+
+def _objects(dm: DataManager) -> set[Path]:
+    return set((dm.repo_path / "objects").rglob("*.parquet"))
+
+
+def test_create_datasets_rejects_identical_data_in_one_batch(dm: DataManager) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="identical data"):
+        dm.create_datasets({"first": df, "second": df.clone()})
+
+    assert dm.list_datasets() == []
+
+
+def test_derive_dataset_rejects_data_identical_to_parent(dm: DataManager) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    parent = dm.create_dataset("users", df, tag="v1")
+
+    with pytest.raises(ValueError, match="identical to its parent"):
+        dm.derive_dataset(parent, df.clone(), tag="v2")
+
+    [meta] = dm.list_datasets()
+    assert meta.ref == parent
+
+
+def test_create_dataset_rejects_data_stored_under_another_name(
+    dm: DataManager,
+) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    first = dm.create_dataset("first", df, tag="v1")
+    child = dm.derive_dataset(first, df.head(2), tag="v2")
+
+    with pytest.raises(ValueError, match="already stored"):
+        dm.create_dataset("second", df.clone(), tag="v1")
+
+    refs: set[str] = {meta.ref for meta in dm.list_datasets()}
+    assert refs == {first, child}
+
+
+def test_update_dataset_rejects_data_of_another_dataset(dm: DataManager) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    dm.create_dataset("first", df, tag="v1")
+    second = dm.create_dataset("second", df.head(1), tag="v1")
+    second_id: str = dm.list_datasets(name_filter="second")[0].id
+
+    with pytest.raises(ValueError, match="already stored"):
+        dm.update_dataset(second_id, df.clone())
+
+    assert dm.get(second_id).collect().equals(df.head(1))
+    assert dm.list_datasets(name_filter="second")[0].ref == second
+
+
+def test_failed_batch_removes_the_objects_it_wrote(dm: DataManager) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    first: str = dm.create_dataset("first", df, tag="v1")
+    before: set[Path] = _objects(dm)
+
+    with pytest.raises(ValueError, match="already stored"):
+        dm.create_datasets({"new1": pl.DataFrame({"b": [1]}), "clash": df.clone()})
+    assert _objects(dm) == before
+
+    # Duplicate inputs within the batch
+    with pytest.raises(ValueError, match="identical data"):
+        dm.create_datasets(
+            {
+                "new1": pl.DataFrame({"b": [1]}),
+                "new2": pl.DataFrame({"c": [1]}),
+                "new3": pl.DataFrame({"c": [1]}),
+            }
+        )
+    assert _objects(dm) == before
+    assert [meta.ref for meta in dm.list_datasets()] == [first]
+
+
+def test_failed_metadata_commit_removes_the_objects_it_wrote(
+    dm: DataManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(metadatas: list[DatasetMetadata]) -> None:
+        msg = f"Cannot save dataset metadata for {len(metadatas)} datasets"
+        raise ValueError(msg)
+
+    monkeypatch.setattr(dm._metadata_repo, "save_many", fail)
+
+    with pytest.raises(ValueError, match="Cannot save"):
+        dm.create_dataset("new", pl.DataFrame({"a": [1]}), tag="v1")
+    assert _objects(dm) == set()
+
+
+def test_resaving_a_version_moves_the_tag_back(dm: DataManager) -> None:
+    d1 = pl.DataFrame({"a": [1]})
+    d2 = pl.DataFrame({"a": [2]})
+    dm.create_dataset("ds", d1, tag="latest")
+    dm.create_dataset("ds", d2, tag="latest")
+
+    ref: str = dm.create_dataset("ds", d1.clone(), tag="latest")
+
+    assert ref == "ds:latest"
+    assert dm.get(dm.list_datasets(tag_filter="latest")[0].id).collect().equals(d1)
+    assert len(dm.list_datasets()) == 2
+
+    # Re-saving with the tag already in place changes nothing
+    assert dm.create_dataset("ds", d1.clone(), tag="latest") == "ds:latest"
+    assert len(dm.list_datasets(tag_filter="latest")) == 1
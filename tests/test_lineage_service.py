@@ -0,0 +1,34 @@
+# Local imports
+from localdm.core import DatasetMetadata
+from localdm.services import LineageIndex
+
+
+def _meta(dataset_id: str, name: str, parent_refs: list[str]) -> DatasetMetadata:
+    return DatasetMetadata(
+        id=dataset_id,
+        hash=f"{dataset_id}-hash",
+        name=name,
+        tags=["v1"],
+        created_at="2024-01-01T00:00:00+00:00",
+        updated_at="2024-01-01T00:00:00+00:00",
+        author="test",
+        parent_refs=parent_refs,
+        description=None,
+        schema=None,
+        stats=None,
+        data_path=f"{dataset_id}.parquet",
+    )
+
+
+def test_index_roots_include_datasets_with_unresolved_parents() -> None:
+    root = _meta("1", "raw", [])
+    child = _meta("2", "clean", ["1"])
+    # Lineage written by older versions stores parent refs, not IDs
+    legacy = _meta("3", "legacy", ["raw:v0"])
+    mixed = _meta("4", "mixed", ["2", "raw:v0"])
+
+    index: LineageIndex = LineageIndex.build([root, child, legacy, mixed])
+
+    assert index.roots == ["3", "1"]
+    assert index.children["1"] == ["2"]
+    assert index.children["2"] == ["4"]
@@ -0,0 +1,26 @@
+# Third-party
+import polars as pl
+import pytest
+
+# Local imports
+from localdm import DataManager
+
+
+def test_delete_many_accepts_repeated_ids(dm: DataManager) -> None:
+    dm.create_dataset("a", pl.DataFrame({"x": [1]}), tag="v1")
+    kept: str = dm.create_dataset("b", pl.DataFrame({"x": [2]}), tag="v1")
+    dataset_id: str = dm.list_datasets(name_filter="a")[0].id
+
+    dm.delete_many([dataset_id, dataset_id])
+
+    assert [meta.ref for meta in dm.list_datasets()] == [kept]
+
+
+def test_delete_many_reports_the_missing_id(dm: DataManager) -> None:
+    dm.create_dataset("a", pl.DataFrame({"x": [1]}), tag="v1")
+    dataset_id: str = dm.list_datasets()[0].id
+    missing = "00000000-0000-0000-0000-000000000000"
+
+    with pytest.raises(KeyError, match=missing):
+        dm.delete_many([dataset_id, dataset_id, missing])
+    assert len(dm.list_datasets()) == 1
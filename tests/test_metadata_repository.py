@@ -0,0 +1,131 @@
+# Standard library
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+# Third-party
+import polars as pl
+import pytest
+
+# Local imports
+from localdm import DataManager
+from localdm.core import get_metadata_db_path
+from localdm.repositories import metadata_repository
+from localdm.repositories.metadata_repository import MetadataRepository, close_all
+
+
+@pytest.fixture(params=["json", "orjson"])
+def codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Store metadata through the stdlib codec, then through orjson."""
+    if request.param == "orjson":
+        monkeypatch.setattr(
+            metadata_repository, "_orjson", pytest.importorskip("orjson")
+        )
+        monkeypatch.setattr(
+            metadata_repository, "_json_dumps", metadata_repository._orjson_dumps
+        )
+        monkeypatch.setattr(
+            metadata_repository, "_json_loads", metadata_repository._orjson_loads
+        )
+    else:
+        monkeypatch.setattr(
+            metadata_repository,
+            "_json_dumps",
+            metadata_repository._JSON_ENCODER.encode,
+        )
+        monkeypatch.setattr(
+            metadata_repository,
+            "_json_loads",
+            metadata_repository._JSON_DECODER.decode,
+        )
+    param: str = request.param
+    return param
+
+
+def _stored_stats_json(dm: DataManager) -> str:
+    with closing(sqlite3.connect(get_metadata_db_path(dm.repo_path))) as conn:
+        stats_json: str = conn.execute("SELECT stats_json FROM datasets").fetchone()[0]
+    return stats_json
+
+
+def test_stats_round_trip_out_of_range_values(codec: str, dm: DataManager) -> None:
+    df = pl.DataFrame(
+        {
+            "f": [1.0, float("inf"), float("-inf"), float("nan")],
+            "i": pl.Series([1, 2**100, 3, 4], dtype=pl.Int128),
+            "u": pl.Series([0, 2**64 - 1, 3, 4], dtype=pl.UInt64),
+        }
+    )
+    dm.create_dataset("wide", df, tag="v1")
+
+    # Both codecs store the same strict JSON text
+    stored: str = _stored_stats_json(dm)
+    assert stored == json.dumps(
+        json.loads(stored), separators=(",", ":"), allow_nan=False
+    ), codec
+
+    repo = MetadataRepository(get_metadata_db_path(dm.repo_path))
+    [meta] = repo.list_datasets()
+    assert meta.stats is not None
+    stats = meta.stats["column_stats"]
+    assert (stats["f"]["min"], stats["f"]["max"]) == (None, None)
+    assert stats["i"]["max"] == str(2**100)
+    assert stats["u"]["max"] == 2**64 - 1
+
+
+def test_legacy_non_finite_stats_load(codec: str, dm: DataManager) -> None:
+    df = pl.DataFrame({"f": [1.0, 2.0]})
+    ref: str = dm.create_dataset("legacy", df, tag="v1")
+    # As written by the stdlib encoder before non-finite values were dropped
+    legacy: str = (
+        '{"row_count":2,"column_count":1,"column_stats":{"f":{"null_count":0,'
+        '"null_percentage":0.0,"unique_count":2,"min":-Infinity,"max":NaN}}}'
+    )
+    with closing(sqlite3.connect(get_metadata_db_path(dm.repo_path))) as conn:
+        conn.execute("UPDATE datasets SET stats_json = ?", (legacy,))
+        conn.commit()
+
+    [meta] = dm.list_datasets()
+    assert meta.stats is not None
+    f_stats = meta.stats["column_stats"]["f"]
+    assert (f_stats["min"], f_stats["max"]) == (None, None), codec
+
+    # Re-saving the decoded stats (unchanged content keeps them) round-trips
+    dm.update_dataset(meta.id, df.clone(), description="again")
+    assert [m.ref for m in dm.list_datasets()] == [ref]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+# Earlier tests may have started the Polars thread pool; the child only uses
+# SQLite, so the multi-threaded fork warning does not apply
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+def test_forked_child_opens_its_own_connection(tmp_path: Path) -> None:
+    db_path: Path = tmp_path / "metadata.db"
+    conn: sqlite3.Connection = metadata_repository._get_conn(db_path)
+
+    pid: int = os.fork()
+    if pid == 0:
+        child_conn: sqlite3.Connection = metadata_repository._get_conn(db_path)
+        usable: bool = child_conn.execute("SELECT 1").fetchone() == (1,)
+        os._exit(0 if child_conn is not conn and usable else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert metadata_repository._get_conn(db_path) is conn
+    close_all()
+
+
+def test_loaded_schemas_are_not_shared(dm: DataManager) -> None:
+    dm.create_dataset("a", pl.DataFrame({"x": [1]}), tag="v1")
+    dm.create_dataset("b", pl.DataFrame({"x": [2]}), tag="v1")
+    first, second = dm.list_datasets()
+    assert first.schema is not None
+    assert second.schema is not None
+
+    first.schema["x"] = "String"
+
+    assert second.schema == {"x": "Int64"}
+    repo = MetadataRepository(get_metadata_db_path(dm.repo_path))
+    assert [meta.schema for meta in repo.list_datasets()] == [{"x": "Int64"}] * 2
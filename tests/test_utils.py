@@ -0,0 +1,43 @@
+# Standard library
+from pathlib import Path
+
+# Third-party
+import polars as pl
+
+# Local imports
+from localdm.core import clear_load_file_cache, compute_hash, load_file
+
+
+def test_heuristic_hash_ignores_chunk_and_null_layout() -> None:
+    a = pl.DataFrame({"x": [1, None, 3], "s": ["a", None, "c"]})
+    b = pl.DataFrame({"x": [4, 5, 6], "s": ["d", "e", "f"]})
+    direct = pl.DataFrame(
+        {"x": [1, None, 3, 4, 5, 6], "s": ["a", None, "c", "d", "e", "f"]}
+    )
+
+    assert compute_hash(pl.concat([a, b], rechunk=False)) == compute_hash(direct)
+    assert compute_hash(pl.concat([a, b])) == compute_hash(direct)
+
+    # A value left in the buffer under a null does not count
+    masked = pl.Series("x", [1, 2, 3]).set(pl.Series([False, True, False]), None)
+    assert compute_hash(masked.to_frame()) == compute_hash(
+        pl.DataFrame({"x": [1, None, 3]})
+    )
+
+
+def test_heuristic_hash_sees_sample_values() -> None:
+    df = pl.DataFrame({"x": [1, 2, 3]})
+    assert compute_hash(df) != compute_hash(df.with_columns(pl.col("x") + 1))
+
+
+def test_load_file_returns_frames_independent_of_the_cache(tmp_path: Path) -> None:
+    path: Path = tmp_path / "data.csv"
+    pl.DataFrame({"a": [1, 2]}).write_csv(path)
+    clear_load_file_cache()
+
+    first: pl.DataFrame = load_file(path)
+    first.insert_column(1, pl.Series("b", [3, 4]))
+    first[0, "a"] = 10
+
+    assert load_file(path).equals(pl.DataFrame({"a": [1, 2]}))
+    clear_load_file_cache()